@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Benchmark the skill validator and policy linter.
+
+Subcommands:
+- lint-hits: compare lint_skill_content against the previous per-match
+  implementation on large, match-heavy SKILL.md files.
+- scale: generate synthetic skill trees of increasing size and time discovery,
+  validation, lint, and the end-to-end CLIs. Results can be saved as JSON and
+  compared against a saved baseline with a regression threshold.
+- dedupe: time the MinHash/LSH near-duplicate index on synthetic name and
+  description sets (50k skills by default) with planted near-duplicates, and
+  check its recall against exact all-pairs comparison on smaller sets.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from itertools import combinations
+from pathlib import Path
+
+from lint_skill_policy import (
+    FORBIDDEN_PATTERNS,
+    REQUIRED_PATTERNS,
+    lint_skill,
+    lint_skill_content,
+    positive_int,
+)
+from skill_dedupe import (
+    DEFAULT_DEDUPE_THRESHOLD,
+    jaccard,
+    near_duplicate_clusters,
+    shingle_set,
+    similarity_threshold,
+)
+from validate_skills import discover_skill_dirs, validate_skill_dir
+
+FILLER_LINE = "Run the workflow step, record the evidence, and continue with the next item.\n"
+FORBIDDEN_LINES = [
+    "Do not stop and ask for routine confirmations.\n",
+    "Never pause execution for trivial checks.\n",
+    "Only merge after explicit approval from the owner.\n",
+]
+POLICY_SECTIONS = """## Proactive autonomy and knowledge compounding
+
+- Default to autonomous execution: do not pause for confirmation between normal in-scope steps.
+- Request user input only when absolutely necessary: ambiguous requirements or destructive actions.
+- Treat iterative execution as the default for non-trivial work; run adaptive loop passes.
+- Keep looping until actual completion criteria are met: verification is green.
+- Run `organise-docs` frequently during execution to capture durable decisions.
+- Create small checkpoint commits frequently with `git-commit` when changes are commit-eligible.
+- Never squash commits; always use merge commits when integrating branches.
+- Prefer simplification over added complexity: aggressively remove bloat, redundancy, and over-engineering while preserving correctness.
+
+## Long-task checkpoint cadence
+
+- Run recurring checkpoint cycles instead of waiting for a single end-of-task wrap-up.
+
+"""
+FRONTMATTER_SHAPES = [
+    'name: {name}\ndescription: "Synthetic skill {name} for validator benchmarks."\n',
+    "name: {name}\ndescription: Synthetic skill {name} for validator benchmarks. # plain scalar\n",
+    "name: {name}\ndescription: >-\n  Synthetic skill {name}\n  for validator benchmarks.\nlicense: MIT\n",
+    "name: '{name}'\ndescription: Synthetic skill {name}.\nmetadata:\n  owner: bench\n  tier: 2\n",
+]
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+
+def reference_lint_skill_content(content: str) -> tuple[list[str], list[str]]:
+    missing: list[str] = []
+    for label, pattern in REQUIRED_PATTERNS:
+        if re.search(pattern, content, re.MULTILINE) is None:
+            missing.append(label)
+    forbidden: list[str] = []
+    for label, pattern in FORBIDDEN_PATTERNS:
+        for match in re.finditer(pattern, content, flags=re.IGNORECASE | re.MULTILINE):
+            line_no = content.count("\n", 0, match.start()) + 1
+            line_text = content.splitlines()[line_no - 1].strip()
+            forbidden.append(f"{label} at line {line_no}: {line_text}")
+    return missing, forbidden
+
+
+def build_body(size_kb: float, hits_per_kb: int, offset: int = 0) -> str:
+    parts: list[str] = []
+    total = 0
+    target = int(size_kb * 1024)
+    kb_index = 0
+    while total < target:
+        chunk_parts = []
+        for hit in range(hits_per_kb):
+            chunk_parts.append(FORBIDDEN_LINES[(offset + kb_index + hit) % len(FORBIDDEN_LINES)])
+        chunk_len = sum(len(part) for part in chunk_parts)
+        while chunk_len < 1024:
+            chunk_parts.append(FILLER_LINE)
+            chunk_len += len(FILLER_LINE)
+        chunk = "".join(chunk_parts)
+        parts.append(chunk)
+        total += len(chunk)
+        kb_index += 1
+    return "".join(parts)
+
+
+def build_skill_md(size_kb: int, hits_per_kb: int) -> str:
+    header = "---\nname: benchmark-skill\ndescription: Synthetic benchmark skill.\n---\n"
+    return header + build_body(size_kb, hits_per_kb)
+
+
+def generate_corpus(
+    root: Path,
+    count: int,
+    sizes_kb: list[float],
+    hit_rate: float,
+    hits_per_kb: int,
+    seed: int,
+) -> None:
+    rng = random.Random(seed)
+    width = len(str(count))
+    for index in range(count):
+        name = f"bench-skill-{index:0{width}d}"
+        skill_dir = root / name
+        skill_dir.mkdir(parents=True)
+        shape = FRONTMATTER_SHAPES[index % len(FRONTMATTER_SHAPES)]
+        hits = hits_per_kb if rng.random() < hit_rate else 0
+        body = build_body(rng.choice(sizes_kb), hits, offset=index)
+        content = f"---\n{shape.format(name=name)}---\n\n# {name}\n\n{POLICY_SECTIONS}{body}"
+        (skill_dir / "SKILL.md").write_text(content, encoding="utf-8")
+        if index % 3 == 0:
+            (skill_dir / "references").mkdir()
+            (skill_dir / "references" / "notes.md").write_text("Reference notes.\n", encoding="utf-8")
+
+
+def generate_descriptions(count: int, duplicate_rate: float, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    syllables = ["ba", "ko", "ri", "te", "lu", "mo", "sa", "ne", "pi", "dar", "gen", "tor"]
+    vocabulary = [
+        "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(4000)
+    ]
+    width = len(str(count))
+    texts: list[str] = []
+    for index in range(count):
+        name = f"bench-skill-{index:0{width}d}"
+        if texts and rng.random() < duplicate_rate:
+            # Planted near-duplicate: an earlier description with one word swapped.
+            words = rng.choice(texts).split(" ", 1)[1].split()
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+        else:
+            words = rng.choices(vocabulary, k=rng.randint(15, 40))
+        texts.append(f"{name} {' '.join(words)}")
+    return texts
+
+
+def exact_duplicate_pairs(texts: list[str], threshold: float) -> set[tuple[int, int]]:
+    shingles = [shingle_set(text) for text in texts]
+    return {
+        (left, right)
+        for left, right in combinations(range(len(texts)), 2)
+        if jaccard(shingles[left], shingles[right]) >= threshold
+    }
+
+
+def best_of(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_cli(cmd: list[str]) -> None:
+    completed = subprocess.run(cmd, text=True, capture_output=True, check=False)
+    # Synthetic corpora include skills with forbidden hits, so exit 1 is expected.
+    if completed.returncode not in (0, 1):
+        raise RuntimeError(f"{' '.join(cmd[:2])} failed: {completed.stderr.strip()}")
+
+
+def scale_case(root: Path, count: int, repeat: int, jobs: int) -> list[dict[str, object]]:
+    skill_dirs = discover_skill_dirs(root, include_system=False)
+    if len(skill_dirs) != count:
+        raise RuntimeError(f"expected {count} skills, discovered {len(skill_dirs)}")
+    skill_files = [skill_dir / "SKILL.md" for skill_dir in skill_dirs]
+    validate_cmd = [
+        sys.executable,
+        str(SCRIPT_DIR / "validate_skills.py"),
+        "--skills-root",
+        str(root),
+        "--no-cache",
+        "--jobs",
+        str(jobs),
+    ]
+    lint_cmd = [
+        sys.executable,
+        str(SCRIPT_DIR / "lint_skill_policy.py"),
+        "--skills-root",
+        str(root),
+        "--jobs",
+        str(jobs),
+    ]
+    cases = [
+        ("discover_skill_dirs", lambda: discover_skill_dirs(root, include_system=False)),
+        ("validate_skill_dir", lambda: [validate_skill_dir(skill_dir) for skill_dir in skill_dirs]),
+        ("lint_skill", lambda: [lint_skill(skill_md) for skill_md in skill_files]),
+        ("validate_skills_cli", lambda: run_cli(validate_cmd)),
+        ("lint_skill_policy_cli", lambda: run_cli(lint_cmd)),
+    ]
+    results = []
+    for benchmark, func in cases:
+        seconds = best_of(func, repeat)
+        results.append(
+            {
+                "benchmark": benchmark,
+                "skills": count,
+                "seconds": round(seconds, 6),
+                "per_skill_us": round(seconds / count * 1e6, 3),
+            }
+        )
+    return results
+
+
+def compare_to_baseline(
+    results: list[dict[str, object]], baseline_file: Path, max_regression: float
+) -> list[str]:
+    baseline = json.loads(baseline_file.read_text(encoding="utf-8"))
+    previous = {(row["benchmark"], row["skills"]): row["seconds"] for row in baseline["results"]}
+    regressions = []
+    for row in results:
+        key = (row["benchmark"], row["skills"])
+        if key not in previous or previous[key] <= 0:
+            continue
+        ratio = row["seconds"] / previous[key]
+        if ratio > 1 + max_regression:
+            regressions.append(
+                f"{row['benchmark']} at {row['skills']} skill(s): "
+                f"{previous[key]:.4f}s -> {row['seconds']:.4f}s ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def run_lint_hits(args: argparse.Namespace) -> int:
+    print(f"{'size_kb':>8} {'hits':>7} {'reference_s':>12} {'current_s':>10} {'speedup':>8}")
+    for size_kb in args.sizes_kb:
+        content = build_skill_md(size_kb, args.hits_per_kb)
+        expected = reference_lint_skill_content(content)
+        actual = lint_skill_content(content)
+        if actual != expected:
+            print(f"Findings differ from the reference implementation at {size_kb} KB.")
+            return 1
+        reference_s = best_of(lambda: reference_lint_skill_content(content), args.repeat)
+        current_s = best_of(lambda: lint_skill_content(content), args.repeat)
+        speedup = reference_s / current_s if current_s else float("inf")
+        print(
+            f"{size_kb:>8} {len(actual[1]):>7} {reference_s:>12.4f} {current_s:>10.4f} {speedup:>7.1f}x"
+        )
+    return 0
+
+
+def run_scale(args: argparse.Namespace) -> int:
+    results: list[dict[str, object]] = []
+    print(f"{'benchmark':<24} {'skills':>8} {'seconds':>10} {'us/skill':>10}")
+    for count in args.counts:
+        root = Path(tempfile.mkdtemp(prefix="skill-bench-"))
+        try:
+            generate_corpus(root, count, args.sizes_kb, args.hit_rate, args.hits_per_kb, args.seed)
+            for row in scale_case(root, count, args.repeat, args.jobs):
+                results.append(row)
+                print(
+                    f"{row['benchmark']:<24} {row['skills']:>8} "
+                    f"{row['seconds']:>10.4f} {row['per_skill_us']:>10.1f}",
+                    flush=True,
+                )
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "jobs": args.jobs,
+        },
+        "corpus": {
+            "sizes_kb": args.sizes_kb,
+            "hit_rate": args.hit_rate,
+            "hits_per_kb": args.hits_per_kb,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {args.output}.")
+
+    if args.baseline:
+        regressions = compare_to_baseline(results, args.baseline, args.max_regression)
+        if regressions:
+            print(f"Benchmark regressions above {args.max_regression:.0%}: {len(regressions)}.")
+            for item in regressions:
+                print(f"- {item}")
+            return 1
+        print(f"No benchmark regressions above {args.max_regression:.0%}.")
+    return 0
+
+
+def run_dedupe(args: argparse.Namespace) -> int:
+    print(
+        f"{'skills':>8} {'lsh_s':>8} {'us/skill':>9} {'clusters':>9} "
+        f"{'all_pairs_s':>12} {'recall':>7}"
+    )
+    for count in args.counts:
+        texts = generate_descriptions(count, args.duplicate_rate, args.seed)
+        clusters: list[tuple[list[int], float, float]] = []
+
+        def run() -> None:
+            clusters[:] = near_duplicate_clusters(texts, args.threshold)
+
+        lsh_s = best_of(run, args.repeat)
+        exact_s = "-"
+        recall = "-"
+        if count <= args.exact_max:
+            started = time.perf_counter()
+            expected = exact_duplicate_pairs(texts, args.threshold)
+            exact_s = f"{time.perf_counter() - started:.4f}"
+            cluster_of = {index: number for number, cluster in enumerate(clusters) for index in cluster[0]}
+            found = sum(
+                1
+                for left, right in expected
+                if left in cluster_of and cluster_of.get(left) == cluster_of.get(right)
+            )
+            recall = f"{found / len(expected):.3f}" if expected else "1.000"
+        print(
+            f"{count:>8} {lsh_s:>8.4f} {lsh_s / count * 1e6:>9.1f} {len(clusters):>9} "
+            f"{exact_s:>12} {recall:>7}",
+            flush=True,
+        )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the skill validator and policy linter.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    lint_hits = subparsers.add_parser(
+        "lint-hits",
+        help="Compare lint_skill_content against the previous per-match implementation.",
+    )
+    lint_hits.add_argument(
+        "--sizes-kb",
+        type=positive_int,
+        nargs="+",
+        default=[16, 128, 512],
+        help="SKILL.md sizes to generate, in KB.",
+    )
+    lint_hits.add_argument(
+        "--hits-per-kb",
+        type=positive_int,
+        default=2,
+        help="Forbidden-phrase hits per KB of generated content.",
+    )
+    lint_hits.add_argument(
+        "--repeat",
+        type=positive_int,
+        default=3,
+        help="Timed runs per case; the best run is reported.",
+    )
+
+    scale = subparsers.add_parser(
+        "scale",
+        help="Time discovery, validation, lint, and the CLIs on synthetic skill trees.",
+    )
+    scale.add_argument(
+        "--counts",
+        type=positive_int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="Skill counts to generate (for example 10 100 1000 10000 100000).",
+    )
+    scale.add_argument(
+        "--sizes-kb",
+        type=float,
+        nargs="+",
+        default=[1, 4, 16, 64],
+        help="SKILL.md body sizes to draw from, in KB.",
+    )
+    scale.add_argument(
+        "--hit-rate",
+        type=float,
+        default=0.1,
+        help="Fraction of skills containing forbidden-phrase hits (default: 0.1).",
+    )
+    scale.add_argument(
+        "--hits-per-kb",
+        type=positive_int,
+        default=1,
+        help="Forbidden-phrase hits per KB in skills that have hits.",
+    )
+    scale.add_argument("--seed", type=int, default=0, help="Corpus generator seed.")
+    scale.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="--jobs value passed to the CLIs (default: 1, for stable comparisons).",
+    )
+    scale.add_argument(
+        "--repeat",
+        type=positive_int,
+        default=1,
+        help="Timed runs per case; the best run is reported.",
+    )
+    scale.add_argument("--output", type=Path, help="Write results as JSON to this file.")
+    scale.add_argument(
+        "--baseline",
+        type=Path,
+        help="JSON results from an earlier run to compare against.",
+    )
+    scale.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown versus --baseline before failing (default: 0.25 = 25%%).",
+    )
+
+    dedupe = subparsers.add_parser(
+        "dedupe",
+        help="Time the near-duplicate index on synthetic names and descriptions.",
+    )
+    dedupe.add_argument(
+        "--counts",
+        type=positive_int,
+        nargs="+",
+        default=[1000, 10000, 50000],
+        help="Skill counts to generate.",
+    )
+    dedupe.add_argument(
+        "--duplicate-rate",
+        type=float,
+        default=0.05,
+        help="Fraction of skills planted as near-duplicates of an earlier skill (default: 0.05).",
+    )
+    dedupe.add_argument(
+        "--threshold",
+        type=similarity_threshold,
+        default=DEFAULT_DEDUPE_THRESHOLD,
+        help=f"Similarity threshold (default: {DEFAULT_DEDUPE_THRESHOLD}).",
+    )
+    dedupe.add_argument(
+        "--exact-max",
+        type=positive_int,
+        default=2000,
+        help="Also run exact all-pairs comparison, and report recall, up to this many skills.",
+    )
+    dedupe.add_argument("--seed", type=int, default=0, help="Corpus generator seed.")
+    dedupe.add_argument(
+        "--repeat",
+        type=positive_int,
+        default=1,
+        help="Timed runs per case; the best run is reported.",
+    )
+
+    args = parser.parse_args()
+    if args.command == "lint-hits":
+        return run_lint_hits(args)
+    if args.command == "dedupe":
+        return run_dedupe(args)
+    return run_scale(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
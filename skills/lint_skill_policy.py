@@ -7,9 +7,35 @@ present in versioned skills.
 """
 
 import argparse
+import bisect
+import hashlib
+import json
+import multiprocessing
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Callable, TypeVar
+
+from skill_report import REPORT_FORMATS, build_record, print_profile, write_report
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Every rule must finish its pathological-input self-test within this budget.
+DEFAULT_RULE_BUDGET_MS = 250
+SELF_TEST_INPUT_KB = 64
+# Generous allowance for the self-test child to start (spawn re-imports modules).
+_SELF_TEST_STARTUP_SECONDS = 30
+# Records that the current rules passed the self-test, so lint runs skip it.
+RULE_SELF_TEST_CACHE_FILENAME = ".lint_skill_policy_cache.json"
+
+# Worker processes only pay off once each one has a reasonable batch of skills;
+# below this, process startup dominates and the serial loop is faster.
+MIN_SKILLS_PER_JOB = 32
 
 
 REQUIRED_PATTERNS = [
@@ -79,26 +105,432 @@ FORBIDDEN_PATTERNS = [
 ]
 
 
+# Compile once per process. Each rule keeps its own regex rather than joining
+# them into one alternation: re only applies its literal-prefix fast scan to a
+# single pattern, and required rules can stop at their first hit.
+_REQUIRED_RULES = [
+    (label, re.compile(pattern, re.MULTILINE)) for label, pattern in REQUIRED_PATTERNS
+]
+_FORBIDDEN_RULES = [
+    (label, re.compile(pattern, re.IGNORECASE | re.MULTILINE))
+    for label, pattern in FORBIDDEN_PATTERNS
+]
+
+
+class LineIndex:
+    """Map character offsets to 1-based line numbers and line text."""
+
+    def __init__(self, content: str) -> None:
+        self.lines = content.split("\n")
+        self.starts: list[int] = []
+        offset = 0
+        for line in self.lines:
+            self.starts.append(offset)
+            offset += len(line) + 1
+
+    def line_no(self, offset: int) -> int:
+        return bisect.bisect_right(self.starts, offset)
+
+    def line_text(self, line_no: int) -> str:
+        return self.lines[line_no - 1]
+
+
+def rule_table() -> list[tuple[str, str, re.Pattern[str]]]:
+    return [("required", label, regex) for label, regex in _REQUIRED_RULES] + [
+        ("forbidden", label, regex) for label, regex in _FORBIDDEN_RULES
+    ]
+
+
+def _literal_text(pattern: str) -> str:
+    text = re.sub(r"\\[bBAZ]", "", pattern)
+    text = re.sub(r"\\(.)", r"\1", text)
+    return re.sub(r"[\^$()|?*+\[\]{}]", "", text)
+
+
+def _literal_runs(pattern: str) -> list[str]:
+    # Stretches of literal characters; metacharacters and class escapes such as \w end one.
+    runs: list[str] = []
+    current = ""
+    for token in re.findall(r"\\.|.", pattern, re.DOTALL):
+        if len(token) == 2 and token[1] not in "bBAZdDsSwW":
+            current += token[1]
+        elif len(token) == 1 and token not in "^$()|?*+[]{}.":
+            current += token
+        elif current:
+            runs.append(current)
+            current = ""
+    if current:
+        runs.append(current)
+    return runs
+
+
+def _repeat_to(unit: str, size: int) -> str:
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def pathological_inputs(pattern: str, size_kb: int) -> list[str]:
+    """Inputs that commonly trigger catastrophic backtracking or scan slowly.
+
+    Long runs of one character, each with and without a character that breaks
+    the match at the very end (the classic `(a+)+$` case); each literal stretch of
+    the rule repeated and then broken the same way; and the rule's own literal
+    text repeated with its final character broken, so a match nearly succeeds at
+    every position.
+    """
+    size = size_kb * 1024
+    literal = _literal_text(pattern) or "a"
+    near_miss = literal[:-1] + "\x00"
+    squashed = literal.replace(" ", "")
+    inputs = [
+        "a" * size,
+        " " * size,
+        "\n" * size,
+        "a" * size + "!",
+        " " * size + "\x00",
+        "\n" * size + "\x00",
+        _repeat_to(near_miss, size),
+        _repeat_to(squashed, size),
+    ]
+    for run in _literal_runs(pattern):
+        inputs.append(_repeat_to(run, size) + "\x00")
+    return list(dict.fromkeys(inputs))
+
+
+class RuleScanTimeout(Exception):
+    """A call on a BoundedWorker overran its deadline; the worker was killed."""
+
+    def __init__(self, item: object, timeout_s: float) -> None:
+        super().__init__(f"did not finish within {timeout_s:.1f} s")
+        self.item = item
+        self.timeout_s = timeout_s
+
+
+def _bounded_worker(conn, func: Callable[[T], R]) -> None:
+    conn.send(None)
+    while True:
+        try:
+            item = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send((True, func(item)))
+        except Exception as error:
+            conn.send((False, error))
+
+
+class BoundedWorker:
+    """Run func in a long-lived child process that is killed when a call overruns.
+
+    A regex match cannot be cancelled from another thread, so anything that
+    applies the policy rules runs here; the child is started again on the next
+    call after a timeout.
+    """
+
+    def __init__(self, func: Callable[[T], R]) -> None:
+        self.func = func
+        self.process: multiprocessing.Process | None = None
+        self.conn = None
+        self._start()
+
+    def _start(self) -> None:
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=_bounded_worker, args=(child_conn, self.func), daemon=True
+        )
+        process.start()
+        child_conn.close()
+        self.process, self.conn = process, parent_conn
+        if not parent_conn.poll(_SELF_TEST_STARTUP_SECONDS):
+            self.close()
+            raise RuntimeError("rule worker process did not start")
+        parent_conn.recv()
+
+    def call(self, item: T, timeout_s: float) -> R:
+        if self.process is None:
+            self._start()
+        self.conn.send(item)
+        if not self.conn.poll(timeout_s):
+            self.close()
+            raise RuleScanTimeout(item, timeout_s)
+        ok, value = self.conn.recv()
+        if not ok:
+            raise value
+        return value
+
+    def close(self) -> None:
+        if self.process is None:
+            return
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+        self.process, self.conn = None, None
+
+
+def _time_rule(index: int, size_kb: int) -> float:
+    regex = rule_table()[index][2]
+    started = time.perf_counter()
+    for text in pathological_inputs(regex.pattern, size_kb):
+        for _ in regex.finditer(text):
+            pass
+    return time.perf_counter() - started
+
+
+def self_test_rules(
+    budget_ms: int = DEFAULT_RULE_BUDGET_MS, size_kb: int = SELF_TEST_INPUT_KB
+) -> list[tuple[str, str, float | None]]:
+    """Time each rule on pathological inputs with a hard per-rule budget.
+
+    Rules run in a BoundedWorker; a rule that overruns its budget is recorded
+    with None and a fresh child continues with the remaining rules.
+    """
+    results: list[tuple[str, str, float | None]] = []
+    worker = BoundedWorker(partial(_time_rule, size_kb=size_kb))
+    try:
+        for index, (kind, label, _) in enumerate(rule_table()):
+            try:
+                elapsed: float | None = worker.call(index, budget_ms / 1000)
+            except RuleScanTimeout:
+                elapsed = None
+            results.append((kind, label, elapsed))
+    finally:
+        worker.close()
+    return results
+
+
+def rule_scan_timeout_s(size_bytes: int, budget_ms: int) -> float:
+    """Deadline for applying every rule to size_bytes of real content.
+
+    Each rule already stays within budget_ms on SELF_TEST_INPUT_KB of pathological
+    input, so allow that per rule for every such block of content.
+    """
+    blocks = max(1.0, size_bytes / (SELF_TEST_INPUT_KB * 1024))
+    return len(rule_table()) * budget_ms / 1000 * blocks
+
+
+def skill_scan_timeout_s(skill_md: Path, budget_ms: int) -> float:
+    try:
+        size_bytes = skill_md.stat().st_size
+    except OSError:
+        size_bytes = 0
+    return rule_scan_timeout_s(size_bytes, budget_ms)
+
+
+def report_rule_scan_timeout(skill_md: Path, timeout_s: float, repo_root: Path) -> int:
+    print(
+        f"Skill policy lint aborted: rules did not finish on {skill_md.relative_to(repo_root)} "
+        f"within {timeout_s:.1f} s. Run lint_skill_policy.py --profile-rules to find the slow rule."
+    )
+    return 1
+
+
+def rules_fingerprint() -> str:
+    digest = hashlib.sha256()
+    digest.update(repr((REQUIRED_PATTERNS, FORBIDDEN_PATTERNS, SELF_TEST_INPUT_KB)).encode("utf-8"))
+    digest.update(Path(__file__).resolve().read_bytes())
+    return digest.hexdigest()
+
+
+def gate_rules(
+    budget_ms: int, cache_file: Path | None
+) -> list[tuple[str, str, float | None]] | None:
+    """Self-test the rules before they touch any skill; return the results only on failure.
+
+    A pass is recorded in cache_file with the rules fingerprint and budget, so
+    it is paid once per rule change rather than once per run.
+    """
+    fingerprint = rules_fingerprint()
+    if cache_file is not None:
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = None
+        if cached == {"fingerprint": fingerprint, "budget_ms": budget_ms}:
+            return None
+    results = self_test_rules(budget_ms)
+    if any(elapsed is None for _, _, elapsed in results):
+        return results
+    if cache_file is not None:
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        try:
+            tmp_file.write_text(
+                json.dumps({"fingerprint": fingerprint, "budget_ms": budget_ms}), encoding="utf-8"
+            )
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            # Read-only checkouts just re-run the self-test next time.
+            pass
+    return None
+
+
+def report_self_test(results: list[tuple[str, str, float | None]], budget_ms: int) -> int:
+    exceeded = [(kind, label) for kind, label, elapsed in results if elapsed is None]
+    if exceeded:
+        print(
+            f"Skill policy rule self-test failed: {len(exceeded)} rule(s) exceeded the "
+            f"{budget_ms} ms budget on pathological input."
+        )
+        for kind, label in exceeded:
+            print(f"- {kind}: {label}")
+        return 1
+    print(f"Skill policy rule self-test passed for {len(results)} rule(s) ({budget_ms} ms budget each).")
+    return 0
+
+
+def _time_rule_on(index: int, contents: list[str]) -> float:
+    regex = rule_table()[index][2]
+    started = time.perf_counter()
+    for content in contents:
+        for _ in regex.finditer(content):
+            pass
+    return time.perf_counter() - started
+
+
+def profile_rules(
+    skill_files: list[Path], self_test: list[tuple[str, str, float | None]], budget_ms: int
+) -> None:
+    contents = [skill_md.read_text(encoding="utf-8") for skill_md in skill_files]
+    total_bytes = sum(len(content.encode("utf-8")) for content in contents)
+    total_kb = total_bytes / 1024
+    # Same per-rule allowance as a lint run gets for this much content.
+    timeout_s = rule_scan_timeout_s(total_bytes, budget_ms) / len(rule_table())
+    worst = {label: elapsed for _, label, elapsed in self_test}
+    rows: list[tuple[float, str]] = []
+    worker = BoundedWorker(partial(_time_rule_on, contents=contents))
+    try:
+        for index, (kind, label, _) in enumerate(rule_table()):
+            if worst[label] is None:
+                rows.append((float("inf"), f"- {kind}: {label}: skipped (exceeded self-test budget)"))
+                continue
+            try:
+                elapsed = worker.call(index, timeout_s)
+            except RuleScanTimeout:
+                message = f"did not finish within {timeout_s:.1f} s on skill content"
+                rows.append((float("inf"), f"- {kind}: {label}: {message}"))
+                continue
+            per_kb_ms = elapsed * 1000 / total_kb if total_kb else 0.0
+            rows.append(
+                (
+                    per_kb_ms,
+                    f"- {kind}: {label}: {per_kb_ms:.4f} ms/KB "
+                    f"(pathological worst {worst[label] * 1000:.1f} ms)",
+                )
+            )
+    finally:
+        worker.close()
+    print(f"Rule cost per KB over {len(contents)} skill(s) ({total_kb:.0f} KB), slowest first:")
+    for _, line in sorted(rows, key=lambda row: row[0], reverse=True):
+        print(line)
+
+
 def repo_root_from_script() -> Path:
     # script: skills/lint_skill_policy.py
     return Path(__file__).resolve().parents[1]
 
 
-def discover_skill_files(skills_root: Path, include_system: bool) -> list[Path]:
-    skill_files: list[Path] = []
-    for child in sorted(skills_root.iterdir()):
-        if not child.is_dir():
+def default_jobs() -> int:
+    return os.cpu_count() or 1
+
+
+def positive_int(value: str) -> int:
+    parsed_value = int(value)
+    if parsed_value <= 0:
+        raise argparse.ArgumentTypeError("value must be > 0")
+    return parsed_value
+
+
+def map_skills(func: Callable[[T], R], items: list[T], jobs: int) -> list[R]:
+    """Apply func to each item, in a process pool when jobs and item count allow.
+
+    Results are returned in input order regardless of the worker count.
+    """
+    workers = min(jobs, len(items) // MIN_SKILLS_PER_JOB)
+    if workers <= 1:
+        return [func(item) for item in items]
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items, chunksize=chunksize))
+
+
+def map_bounded(
+    func: Callable[[T], R], items: list[T], jobs: int, timeout_for: Callable[[T], float]
+) -> list[R]:
+    """Like map_skills, but every call runs in a BoundedWorker under timeout_for(item).
+
+    Items are split into one contiguous slice per worker. Raises RuleScanTimeout
+    for an item that overruns, so a rule that slipped past the self-test cannot
+    hang the run.
+    """
+    if not items:
+        return []
+    workers = max(1, min(jobs, len(items) // MIN_SKILLS_PER_JOB))
+    size = -(-len(items) // workers)
+    chunks = [items[start : start + size] for start in range(0, len(items), size)]
+    # Start every child from this thread; forking from the dispatch threads is unsafe.
+    pool = [BoundedWorker(func) for _ in chunks]
+
+    def run(worker: BoundedWorker, chunk: list[T]) -> list[R]:
+        return [worker.call(item, timeout_for(item)) for item in chunk]
+
+    try:
+        if len(pool) == 1:
+            return run(pool[0], chunks[0])
+        with ThreadPoolExecutor(max_workers=len(pool)) as executor:
+            return [result for part in executor.map(run, pool, chunks) for result in part]
+    finally:
+        for worker in pool:
+            worker.close()
+
+
+SKILL_ASSET_DIRS = {"references", "scripts", "agents", "assets"}
+
+
+def _sorted_dir_entries(path: str | Path) -> list[os.DirEntry]:
+    try:
+        with os.scandir(path) as entries:
+            return sorted(entries, key=lambda entry: entry.name)
+    except OSError:
+        return []
+
+
+def list_skill_files(skill_dir: Path) -> frozenset[str]:
+    """List a skill's files as skill-relative paths with one scandir per directory.
+
+    Covers top-level files and one level of the standard asset directories, which
+    is enough to find SKILL.md and check the assets it names without per-file stats.
+    """
+    files: set[str] = set()
+    for entry in _sorted_dir_entries(skill_dir):
+        if not entry.is_dir():
+            files.add(entry.name)
+        elif entry.name in SKILL_ASSET_DIRS:
+            for child in _sorted_dir_entries(entry.path):
+                files.add(f"{entry.name}/{child.name}")
+    return frozenset(files)
+
+
+def scan_skill_tree(skills_root: Path, include_system: bool) -> dict[Path, frozenset[str]]:
+    """Map each skill directory under skills_root to its list_skill_files listing."""
+    tree: dict[Path, frozenset[str]] = {}
+    for entry in _sorted_dir_entries(skills_root):
+        if not entry.is_dir():
             continue
-        if child.name.startswith(".") and not include_system:
+        if entry.name.startswith(".") and not include_system:
             continue
-        skill_md = child / "SKILL.md"
-        if skill_md.exists():
-            skill_files.append(skill_md)
+        files = list_skill_files(Path(entry.path))
+        if "SKILL.md" in files:
+            tree[Path(entry.path)] = files
     if include_system:
-        for skill_md in sorted(skills_root.glob(".system/*/SKILL.md")):
-            if skill_md not in skill_files:
-                skill_files.append(skill_md)
-    return skill_files
+        for entry in _sorted_dir_entries(skills_root / ".system"):
+            skill_dir = Path(entry.path)
+            if entry.is_dir() and skill_dir not in tree:
+                files = list_skill_files(skill_dir)
+                if "SKILL.md" in files:
+                    tree[skill_dir] = files
+    return tree
+
+
+def discover_skill_files(skills_root: Path, include_system: bool) -> list[Path]:
+    return [skill_dir / "SKILL.md" for skill_dir in scan_skill_tree(skills_root, include_system)]
 
 
 def normalize_targets(targets: list[str]) -> list[Path]:
@@ -118,19 +550,109 @@ def normalize_targets(targets: list[str]) -> list[Path]:
     return normalized
 
 
-def lint_skill(skill_md: Path) -> tuple[list[str], list[str]]:
-    content = skill_md.read_text(encoding="utf-8")
+def lint_skill_content(
+    content: str, rule_timings: dict[str, float] | None = None
+) -> tuple[list[str], list[str]]:
+    missing = find_missing_required(content, rule_timings)
+    forbidden = [
+        f"{label} at line {line_no}: {line_text.strip()}"
+        for label, line_no, _, _, line_text in find_forbidden_hits(content, rule_timings)
+    ]
+    return missing, forbidden
+
+
+def find_missing_required(
+    content: str, rule_timings: dict[str, float] | None = None
+) -> list[str]:
     missing: list[str] = []
-    for label, pattern in REQUIRED_PATTERNS:
-        if re.search(pattern, content, re.MULTILINE) is None:
+    for label, regex in _REQUIRED_RULES:
+        started = time.perf_counter()
+        if regex.search(content) is None:
             missing.append(label)
-    forbidden: list[str] = []
-    for label, pattern in FORBIDDEN_PATTERNS:
-        for match in re.finditer(pattern, content, flags=re.IGNORECASE | re.MULTILINE):
-            line_no = content.count("\n", 0, match.start()) + 1
-            line_text = content.splitlines()[line_no - 1].strip()
-            forbidden.append(f"{label} at line {line_no}: {line_text}")
-    return missing, forbidden
+        if rule_timings is not None:
+            rule_timings[label] = time.perf_counter() - started
+    return missing
+
+
+def find_forbidden_hits(
+    content: str, rule_timings: dict[str, float] | None = None
+) -> list[tuple[str, int, int, int, str]]:
+    """Return (label, line_no, start_column, end_column, line_text) per forbidden match."""
+    hits: list[tuple[str, int, int, int, str]] = []
+    # Built on the first forbidden hit only; clean files never pay for it.
+    line_index: LineIndex | None = None
+    for label, regex in _FORBIDDEN_RULES:
+        started = time.perf_counter()
+        for match in regex.finditer(content):
+            if line_index is None:
+                line_index = LineIndex(content)
+            line_no = line_index.line_no(match.start())
+            column = match.start() - line_index.starts[line_no - 1]
+            line_text = line_index.line_text(line_no)
+            end_column = min(column + len(match.group(0)), len(line_text))
+            hits.append((label, line_no, column, end_column, line_text))
+        if rule_timings is not None:
+            rule_timings[label] = time.perf_counter() - started
+    return hits
+
+
+def scan_rules(content: str) -> tuple[list[str], list[tuple[str, int, int, int, str]]]:
+    return find_missing_required(content), find_forbidden_hits(content)
+
+
+def lint_skill(skill_md: Path) -> tuple[list[str], list[str]]:
+    return lint_skill_content(skill_md.read_text(encoding="utf-8"))
+
+
+def lint_skill_timed(skill_md: Path) -> tuple[list[str], list[str], dict[str, object]]:
+    started = time.perf_counter()
+    content = skill_md.read_text(encoding="utf-8")
+    rule_timings: dict[str, float] = {}
+    timings: dict[str, object] = {"read_s": time.perf_counter() - started, "rules": rule_timings}
+    missing, forbidden = lint_skill_content(content, rule_timings)
+    return missing, forbidden, timings
+
+
+def lint_failure_messages(missing: list[str], forbidden: list[str]) -> list[str]:
+    return [f"missing: {item}" for item in missing] + [f"forbidden: {item}" for item in forbidden]
+
+
+def add_report_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--report",
+        choices=REPORT_FORMATS,
+        help="Also write a machine-readable report with per-skill and per-rule timings.",
+    )
+    parser.add_argument(
+        "--report-file",
+        type=Path,
+        help="Where to write the --report output (required with --report).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the slowest skills and rules after the run.",
+    )
+
+
+def report_lint_failures(
+    failures: list[tuple[Path, list[str], list[str]]],
+    skill_count: int,
+    repo_root: Path,
+) -> int:
+    if failures:
+        print(f"Skill policy lint failed: {len(failures)} skill(s) need fixes.")
+        for skill_md, missing, forbidden in sorted(failures, key=lambda item: item[0]):
+            rel = skill_md.relative_to(repo_root)
+            print(f"- {rel}")
+            for item in missing:
+                print(f"  - missing: {item}")
+            for item in forbidden:
+                print(f"  - forbidden: {item}")
+        return 1
+
+    print(f"Skill policy lint passed for {skill_count} skill(s).")
+    return 0
 
 
 def main() -> int:
@@ -142,15 +664,53 @@ def main() -> int:
         nargs="*",
         help="Optional skill directories or SKILL.md files. Defaults to repo skills/*.",
     )
+    parser.add_argument(
+        "--skills-root",
+        type=Path,
+        help="Skills directory to discover skills in. Defaults to this repo's skills/.",
+    )
     parser.add_argument(
         "--include-system",
         action="store_true",
         help="Include skills under skills/.system/*.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=default_jobs(),
+        help="Number of worker processes. Defaults to the CPU count.",
+    )
+    add_report_arguments(parser)
+    parser.add_argument(
+        "--self-test-rules",
+        action="store_true",
+        help="Run every rule against pathological inputs under --rule-budget-ms and exit.",
+    )
+    parser.add_argument(
+        "--profile-rules",
+        action="store_true",
+        help="Report each rule's cost per KB of skill content (after the self-test) and exit.",
+    )
+    parser.add_argument(
+        "--rule-budget-ms",
+        type=positive_int,
+        default=DEFAULT_RULE_BUDGET_MS,
+        help=f"Per-rule self-test time budget in milliseconds (default: {DEFAULT_RULE_BUDGET_MS}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-run the rule self-test even if skills/{RULE_SELF_TEST_CACHE_FILENAME} records a pass.",
+    )
     args = parser.parse_args()
+    if args.report and not args.report_file:
+        parser.error("--report requires --report-file")
 
     repo_root = repo_root_from_script()
     skills_root = repo_root / "skills"
+    if args.skills_root:
+        skills_root = args.skills_root.expanduser().resolve()
+        repo_root = skills_root.parent
 
     if args.targets:
         skill_files = normalize_targets(args.targets)
@@ -161,25 +721,47 @@ def main() -> int:
         print("No SKILL.md files found to lint.")
         return 1
 
+    if args.self_test_rules or args.profile_rules:
+        self_test = self_test_rules(args.rule_budget_ms)
+        returncode = report_self_test(self_test, args.rule_budget_ms)
+        if args.profile_rules:
+            profile_rules(skill_files, self_test, args.rule_budget_ms)
+        return returncode
+
+    # Same gate as validate_skills.py: a backtracking-prone rule is caught in a
+    # killable child process instead of hanging the lint run.
+    cache_file = None if args.no_cache else skills_root / RULE_SELF_TEST_CACHE_FILENAME
+    failed_self_test = gate_rules(args.rule_budget_ms, cache_file)
+    if failed_self_test is not None:
+        return report_self_test(failed_self_test, args.rule_budget_ms)
+
+    timed = bool(args.report or args.profile)
+    timeout_for = partial(skill_scan_timeout_s, budget_ms=args.rule_budget_ms)
+    try:
+        if timed:
+            results = map_bounded(lint_skill_timed, skill_files, args.jobs, timeout_for)
+        else:
+            results = [
+                (*result, None)
+                for result in map_bounded(lint_skill, skill_files, args.jobs, timeout_for)
+            ]
+    except RuleScanTimeout as error:
+        return report_rule_scan_timeout(error.item, error.timeout_s, repo_root)
     failures: list[tuple[Path, list[str], list[str]]] = []
-    for skill_md in skill_files:
-        missing, forbidden = lint_skill(skill_md)
+    records: list[dict[str, object]] = []
+    for skill_md, (missing, forbidden, timings) in zip(skill_files, results):
         if missing or forbidden:
             failures.append((skill_md, missing, forbidden))
+        if timed:
+            rel = skill_md.relative_to(repo_root).as_posix()
+            records.append(build_record(rel, lint_failure_messages(missing, forbidden), timings))
 
-    if failures:
-        print(f"Skill policy lint failed: {len(failures)} skill(s) need fixes.")
-        for skill_md, missing, forbidden in failures:
-            rel = skill_md.relative_to(repo_root)
-            print(f"- {rel}")
-            for item in missing:
-                print(f"  - missing: {item}")
-            for item in forbidden:
-                print(f"  - forbidden: {item}")
-        return 1
-
-    print(f"Skill policy lint passed for {len(skill_files)} skill(s).")
-    return 0
+    returncode = report_lint_failures(failures, len(skill_files), repo_root)
+    if args.report:
+        write_report(args.report, args.report_file, "lint_skill_policy", records)
+    if args.profile:
+        print_profile(records)
+    return returncode
 
 
 if __name__ == "__main__":
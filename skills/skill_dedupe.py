@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection for skill names and descriptions (`validate_skills.py --dedupe`).
+
+Each skill's "name description" text is reduced to word-bigram shingles and a
+MinHash signature; LSH banding turns the signatures into buckets so only skills
+that share a bucket are compared, which keeps the run close to linear in the
+number of skills. Candidate pairs are confirmed with the exact Jaccard
+similarity of their shingle sets before they are reported.
+
+Signatures use one-permutation hashing (each shingle is hashed once and lands
+in one of NUM_PERM bins, empty bins are densified from filled ones) so the pure-Python
+cost per skill is proportional to its shingle count, not shingles x NUM_PERM.
+"""
+
+import argparse
+import random
+import re
+import zlib
+
+SHINGLE_WORDS = 2
+NUM_PERM = 128
+DEFAULT_DEDUPE_THRESHOLD = 0.7
+
+_MASK64 = (1 << 64) - 1
+_MIX = 0x9E3779B97F4A7C15
+_BIN_SHIFT = 64 - (NUM_PERM.bit_length() - 1)
+_VALUE_MASK = (1 << _BIN_SHIFT) - 1
+_PROBE_ORDER = [random.Random(index).sample(range(NUM_PERM), NUM_PERM) for index in range(NUM_PERM)]
+_NON_WORD_RE = re.compile(r"[^0-9a-z]+")
+
+
+def similarity_threshold(value: str) -> float:
+    parsed_value = float(value)
+    if not 0 < parsed_value <= 1:
+        raise argparse.ArgumentTypeError("value must be in (0, 1]")
+    return parsed_value
+
+
+def normalize_text(text: str) -> str:
+    return _NON_WORD_RE.sub(" ", text.lower()).strip()
+
+
+def shingle_set(text: str, size: int = SHINGLE_WORDS) -> frozenset[int]:
+    words = normalize_text(text).encode("utf-8").split()
+    if len(words) <= size:
+        return frozenset([zlib.crc32(b" ".join(words))]) if words else frozenset()
+    return frozenset(
+        zlib.crc32(b" ".join(words[i : i + size])) for i in range(len(words) - size + 1)
+    )
+
+
+def minhash_signature(shingles: frozenset[int]) -> list[int] | None:
+    if not shingles:
+        return None
+    bins: list[int | None] = [None] * NUM_PERM
+    for shingle in shingles:
+        mixed = (shingle * _MIX) & _MASK64
+        bin_index = mixed >> _BIN_SHIFT
+        value = mixed & _VALUE_MASK
+        current = bins[bin_index]
+        if current is None or value < current:
+            bins[bin_index] = value
+    # Densify: an empty bin takes the value of the first filled bin in its own fixed
+    # pseudo-random probe order, so neighbouring empty bins borrow from unrelated
+    # donors and one shared shingle cannot make a whole band agree.
+    signature = list(bins)
+    for index, value in enumerate(bins):
+        if value is None:
+            for donor in _PROBE_ORDER[index]:
+                if bins[donor] is not None:
+                    signature[index] = bins[donor]
+                    break
+    return signature
+
+
+def lsh_bands(threshold: float) -> tuple[int, int]:
+    # Pick the banding whose S-curve midpoint (1/b)^(1/r) is the highest one at or
+    # below the threshold: recall is kept, and exact Jaccard drops false positives.
+    best = (NUM_PERM, 1)
+    best_midpoint = 0.0
+    for rows in range(1, NUM_PERM + 1):
+        if NUM_PERM % rows:
+            continue
+        bands = NUM_PERM // rows
+        midpoint = (1 / bands) ** (1 / rows)
+        if best_midpoint < midpoint <= threshold:
+            best, best_midpoint = (bands, rows), midpoint
+    return best
+
+
+def jaccard(left: frozenset[int], right: frozenset[int]) -> float:
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+def near_duplicate_clusters(
+    texts: list[str], threshold: float = DEFAULT_DEDUPE_THRESHOLD
+) -> list[tuple[list[int], float, float]]:
+    """Return (member indices, min similarity, max similarity) for each cluster."""
+    shingles = [shingle_set(text) for text in texts]
+    bands, rows = lsh_bands(threshold)
+    # One dict per band, keyed by the hash of the band's slice. A bucket holds a bare
+    # index until a second skill lands in it, which keeps memory low at 50k+ skills.
+    buckets: list[dict[int, int | list[int]]] = [{} for _ in range(bands)]
+    for index, shingle in enumerate(shingles):
+        signature = minhash_signature(shingle)
+        if signature is None:
+            continue
+        for band in range(bands):
+            key = hash(tuple(signature[band * rows : (band + 1) * rows]))
+            bucket = buckets[band].get(key)
+            if bucket is None:
+                buckets[band][key] = index
+            elif isinstance(bucket, int):
+                buckets[band][key] = [bucket, index]
+            else:
+                bucket.append(index)
+
+    parent = list(range(len(texts)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    edges: dict[tuple[int, int], float] = {}
+    checked: set[tuple[int, int]] = set()
+    for band_buckets in buckets:
+        for bucket in band_buckets.values():
+            if isinstance(bucket, int):
+                continue
+            # Compare each member against the bucket's cluster leaders rather than all
+            # pairs, so a large bucket of near-identical skills stays linear.
+            leaders: list[int] = []
+            for member in bucket:
+                for leader in leaders:
+                    if find(leader) == find(member):
+                        break
+                    pair = (leader, member) if leader < member else (member, leader)
+                    if pair in checked:
+                        continue
+                    checked.add(pair)
+                    similarity = jaccard(shingles[leader], shingles[member])
+                    if similarity >= threshold:
+                        edges[pair] = similarity
+                        parent[find(member)] = find(leader)
+                        break
+                else:
+                    leaders.append(member)
+
+    groups: dict[int, set[int]] = {}
+    similarities: dict[int, list[float]] = {}
+    for (left, right), similarity in edges.items():
+        root = find(left)
+        groups.setdefault(root, set()).update((left, right))
+        similarities.setdefault(root, []).append(similarity)
+    clusters = [
+        (sorted(members), min(similarities[root]), max(similarities[root]))
+        for root, members in groups.items()
+    ]
+    clusters.sort(key=lambda cluster: cluster[0])
+    return clusters
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Machine-readable reports and timing profiles for skill validation and lint.
+
+Each record describes one skill:
+    {"path": "skills/<name>", "failures": [...], "cached": bool,
+     "timings": {"read_s": float, "frontmatter_s": float, "rules": {label: float}}}
+"""
+
+import json
+from pathlib import Path
+from xml.etree import ElementTree
+
+REPORT_FORMATS = ("json", "junit")
+
+
+def record_total_seconds(record: dict[str, object]) -> float:
+    timings = record.get("timings") or {}
+    total = timings.get("read_s", 0.0) + timings.get("frontmatter_s", 0.0)
+    return total + sum(timings.get("rules", {}).values())
+
+
+def build_record(
+    path: str,
+    failures: list[str],
+    timings: dict[str, object] | None,
+    cached: bool = False,
+) -> dict[str, object]:
+    return {
+        "path": path,
+        "status": "failed" if failures else "passed",
+        "failures": failures,
+        "cached": cached,
+        "timings": timings or {},
+    }
+
+
+def _render_json(tool: str, records: list[dict[str, object]]) -> str:
+    payload = {
+        "tool": tool,
+        "summary": {
+            "skills": len(records),
+            "failed": sum(1 for record in records if record["failures"]),
+            "total_s": round(sum(record_total_seconds(record) for record in records), 6),
+        },
+        "skills": records,
+    }
+    return json.dumps(payload, indent=2) + "\n"
+
+
+def _render_junit(tool: str, records: list[dict[str, object]]) -> str:
+    suite = ElementTree.Element(
+        "testsuite",
+        name=tool,
+        tests=str(len(records)),
+        failures=str(sum(1 for record in records if record["failures"])),
+        time=f"{sum(record_total_seconds(record) for record in records):.6f}",
+    )
+    for record in records:
+        case = ElementTree.SubElement(
+            suite,
+            "testcase",
+            classname=tool,
+            name=str(record["path"]),
+            time=f"{record_total_seconds(record):.6f}",
+        )
+        timings = record["timings"]
+        properties = ElementTree.SubElement(case, "properties")
+        ElementTree.SubElement(properties, "property", name="cached", value=str(record["cached"]).lower())
+        for key in ("read_s", "frontmatter_s"):
+            if key in timings:
+                ElementTree.SubElement(properties, "property", name=key, value=f"{timings[key]:.6f}")
+        for label, seconds in timings.get("rules", {}).items():
+            ElementTree.SubElement(properties, "property", name=f"rule:{label}", value=f"{seconds:.6f}")
+        if record["failures"]:
+            failure = ElementTree.SubElement(case, "failure", message=str(record["failures"][0]))
+            failure.text = "\n".join(record["failures"])
+    root = ElementTree.Element("testsuites")
+    root.append(suite)
+    ElementTree.indent(root)
+    return ElementTree.tostring(root, encoding="unicode", xml_declaration=True) + "\n"
+
+
+def write_report(report_format: str, report_file: Path, tool: str, records: list[dict[str, object]]) -> None:
+    if report_format == "json":
+        text = _render_json(tool, records)
+    else:
+        text = _render_junit(tool, records)
+    report_file.write_text(text, encoding="utf-8")
+
+
+def print_profile(records: list[dict[str, object]], limit: int = 10) -> None:
+    timed = [record for record in records if not record["cached"]]
+    print(f"Profile: {len(timed)} skill(s) timed, {len(records) - len(timed)} served from cache.")
+    print(f"Slowest skills (top {min(limit, len(timed))}):")
+    for record in sorted(timed, key=record_total_seconds, reverse=True)[:limit]:
+        timings = record["timings"]
+        phases = [
+            f"{key[:-2]} {timings[key] * 1000:.2f} ms"
+            for key in ("read_s", "frontmatter_s")
+            if key in timings
+        ]
+        print(f"- {record['path']}: {record_total_seconds(record) * 1000:.2f} ms ({', '.join(phases)})")
+    rule_totals: dict[str, float] = {}
+    for record in timed:
+        for label, seconds in record["timings"].get("rules", {}).items():
+            rule_totals[label] = rule_totals.get(label, 0.0) + seconds
+    if rule_totals:
+        print(f"Slowest rules (top {min(limit, len(rule_totals))}, summed across skills):")
+        for label, seconds in sorted(rule_totals.items(), key=lambda item: item[1], reverse=True)[:limit]:
+            print(f"- {label}: {seconds * 1000:.2f} ms")
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Long-lived skill validation server for editors, speaking LSP-style JSON-RPC over stdio.
+
+Keeps one process warm so every check reuses the compiled policy regexes and the
+discovered skill set. Supported messages:
+- initialize / initialized / shutdown / exit
+- textDocument/didOpen, didChange (full sync), didSave, didClose: publish
+  diagnostics for SKILL.md buffers, including unsaved contents
+- skills/validate: request with {"uri" or "path", optional "text"}; returns
+  {"diagnostics": [...]} directly, for scripts and tests
+
+Example editor setup: run `python3 skills/skill_server.py` as the language
+server command for Markdown files.
+"""
+
+import argparse
+import contextlib
+import json
+import sys
+from pathlib import Path
+from typing import BinaryIO
+from urllib.parse import unquote, urlparse
+
+from lint_skill_policy import (
+    DEFAULT_RULE_BUDGET_MS,
+    RULE_SELF_TEST_CACHE_FILENAME,
+    BoundedWorker,
+    RuleScanTimeout,
+    gate_rules,
+    list_skill_files,
+    positive_int,
+    report_self_test,
+    rule_scan_timeout_s,
+    scan_rules,
+    scan_skill_tree,
+)
+from validate_skills import (
+    MAX_FRONTMATTER_BYTES,
+    find_asset_references,
+    repo_root_from_script,
+    validate_skill_content,
+)
+
+SEVERITY_ERROR = 1
+SOURCE = "skill-validate"
+TEXT_DOCUMENT_SYNC_FULL = 1
+
+
+def read_message(stream: BinaryIO) -> dict[str, object] | None:
+    content_length = None
+    while True:
+        header = stream.readline()
+        if not header:
+            return None
+        header = header.strip()
+        if not header:
+            break
+        name, _, value = header.decode("ascii").partition(":")
+        if name.strip().lower() == "content-length":
+            content_length = int(value.strip())
+    if content_length is None:
+        raise ValueError("missing Content-Length header")
+    return json.loads(stream.read(content_length).decode("utf-8"))
+
+
+def write_message(stream: BinaryIO, message: dict[str, object]) -> None:
+    body = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    stream.flush()
+
+
+def uri_to_path(uri: str) -> Path:
+    return Path(unquote(urlparse(uri).path))
+
+
+def _utf16_column(line_text: str, column: int) -> int:
+    # LSP positions count UTF-16 code units by default, not code points.
+    return len(line_text[:column].encode("utf-16-le")) // 2
+
+
+def _diagnostic(line: int, start: int, end: int, message: str) -> dict[str, object]:
+    return {
+        "range": {
+            "start": {"line": line, "character": start},
+            "end": {"line": line, "character": end},
+        },
+        "severity": SEVERITY_ERROR,
+        "source": SOURCE,
+        "message": message,
+    }
+
+
+class SkillValidationServer:
+    def __init__(
+        self,
+        skills_root: Path,
+        include_system: bool,
+        max_frontmatter_bytes: int,
+        rule_budget_ms: int = DEFAULT_RULE_BUDGET_MS,
+    ) -> None:
+        self.max_frontmatter_bytes = max_frontmatter_bytes
+        self.rule_budget_ms = rule_budget_ms
+        # The rules run in a warm child that is killed and restarted if a scan overruns.
+        self.rule_worker = BoundedWorker(scan_rules)
+        # Discovered once; a skill's listing is refreshed only when it is saved.
+        self.listings = scan_skill_tree(skills_root, include_system)
+        self.documents: dict[str, str] = {}
+        self.shutdown_requested = False
+
+    def listing(self, skill_dir: Path, refresh: bool = False) -> frozenset[str]:
+        if refresh or skill_dir not in self.listings:
+            self.listings[skill_dir] = list_skill_files(skill_dir)
+        return self.listings[skill_dir]
+
+    def diagnose(self, path: Path, text: str) -> list[dict[str, object]]:
+        if path.name != "SKILL.md":
+            return []
+        diagnostics: list[dict[str, object]] = []
+        valid, message = validate_skill_content(text, self.max_frontmatter_bytes)
+        if not valid:
+            diagnostics.append(_diagnostic(0, 0, 0, message))
+        timeout_s = rule_scan_timeout_s(len(text.encode("utf-8")), self.rule_budget_ms)
+        try:
+            missing, forbidden = self.rule_worker.call(text, timeout_s)
+        except RuleScanTimeout:
+            missing, forbidden = [], []
+            diagnostics.append(
+                _diagnostic(0, 0, 0, f"policy rules did not finish within {timeout_s:.1f} s; skipped")
+            )
+        for label in missing:
+            diagnostics.append(_diagnostic(0, 0, 0, f"missing required policy text: {label}"))
+        for label, line_no, start, end, line_text in forbidden:
+            diagnostics.append(
+                _diagnostic(
+                    line_no - 1,
+                    _utf16_column(line_text, start),
+                    _utf16_column(line_text, end),
+                    f"forbidden: {label}",
+                )
+            )
+        files = self.listing(path.parent)
+        absent = [ref for ref in find_asset_references(text, path.parent.name) if ref not in files]
+        if absent:
+            diagnostics.append(
+                _diagnostic(0, 0, 0, f"Referenced file(s) not found: {', '.join(absent)}")
+            )
+        return diagnostics
+
+    def _publish(self, uri: str) -> dict[str, object]:
+        text = self.documents.get(uri, "")
+        diagnostics = self.diagnose(uri_to_path(uri), text) if uri in self.documents else []
+        return {
+            "jsonrpc": "2.0",
+            "method": "textDocument/publishDiagnostics",
+            "params": {"uri": uri, "diagnostics": diagnostics},
+        }
+
+    def handle(self, message: dict[str, object]) -> list[dict[str, object]]:
+        method = message.get("method")
+        params = message.get("params") or {}
+        msg_id = message.get("id")
+
+        def reply(result: object) -> list[dict[str, object]]:
+            return [{"jsonrpc": "2.0", "id": msg_id, "result": result}]
+
+        if method == "initialize":
+            return reply(
+                {
+                    "capabilities": {
+                        "textDocumentSync": {
+                            "openClose": True,
+                            "change": TEXT_DOCUMENT_SYNC_FULL,
+                            "save": True,
+                        }
+                    },
+                    "serverInfo": {"name": "skill-validation-server"},
+                }
+            )
+        if method == "shutdown":
+            self.shutdown_requested = True
+            return reply(None)
+        if method == "skills/validate":
+            if "uri" in params:
+                path = uri_to_path(params["uri"])
+            else:
+                path = Path(params["path"]).expanduser().resolve()
+            text = params.get("text")
+            if text is None:
+                text = path.read_text(encoding="utf-8")
+            return reply({"diagnostics": self.diagnose(path, text)})
+
+        document = params.get("textDocument") or {}
+        uri = document.get("uri")
+        if method == "textDocument/didOpen":
+            self.documents[uri] = document.get("text", "")
+            return [self._publish(uri)]
+        if method == "textDocument/didChange":
+            changes = params.get("contentChanges") or []
+            if changes:
+                self.documents[uri] = changes[-1]["text"]
+            return [self._publish(uri)]
+        if method == "textDocument/didSave":
+            if params.get("text") is not None:
+                self.documents[uri] = params["text"]
+            self.listing(uri_to_path(uri).parent, refresh=True)
+            return [self._publish(uri)]
+        if method == "textDocument/didClose":
+            self.documents.pop(uri, None)
+            return [self._publish(uri)]
+
+        if msg_id is not None:
+            return [
+                {
+                    "jsonrpc": "2.0",
+                    "id": msg_id,
+                    "error": {"code": -32601, "message": f"Method not found: {method}"},
+                }
+            ]
+        # Unknown notifications (for example "initialized") need no response.
+        return []
+
+
+def serve(server: SkillValidationServer, stdin: BinaryIO, stdout: BinaryIO) -> int:
+    while True:
+        try:
+            message = read_message(stdin)
+        except (ValueError, UnicodeDecodeError) as error:
+            write_message(
+                stdout,
+                {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": str(error)}},
+            )
+            continue
+        if message is None:
+            return 0 if server.shutdown_requested else 1
+        if message.get("method") == "exit":
+            return 0 if server.shutdown_requested else 1
+        try:
+            responses = server.handle(message)
+        except (OSError, KeyError, TypeError, ValueError) as error:
+            if message.get("id") is None:
+                continue
+            responses = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": message.get("id"),
+                    "error": {"code": -32603, "message": str(error)},
+                }
+            ]
+        for response in responses:
+            write_message(stdout, response)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Serve skill validation diagnostics over LSP-style JSON-RPC on stdio."
+    )
+    parser.add_argument(
+        "--skills-root",
+        type=Path,
+        help="Skills directory to discover skills in. Defaults to this repo's skills/.",
+    )
+    parser.add_argument(
+        "--include-system",
+        action="store_true",
+        help="Include skills under skills/.system/*.",
+    )
+    parser.add_argument(
+        "--rule-budget-ms",
+        type=positive_int,
+        default=DEFAULT_RULE_BUDGET_MS,
+        help=f"Per-rule self-test time budget in milliseconds (default: {DEFAULT_RULE_BUDGET_MS}).",
+    )
+    args = parser.parse_args()
+
+    skills_root = repo_root_from_script() / "skills"
+    if args.skills_root:
+        skills_root = args.skills_root.expanduser().resolve()
+    # Vet the rules once at startup so a backtracking-prone rule cannot hang
+    # diagnostics mid-session. stdout carries the protocol, so report on stderr.
+    failed_self_test = gate_rules(args.rule_budget_ms, skills_root / RULE_SELF_TEST_CACHE_FILENAME)
+    if failed_self_test is not None:
+        with contextlib.redirect_stdout(sys.stderr):
+            return report_self_test(failed_self_test, args.rule_budget_ms)
+    server = SkillValidationServer(
+        skills_root, args.include_system, MAX_FRONTMATTER_BYTES, args.rule_budget_ms
+    )
+    try:
+        return serve(server, sys.stdin.buffer, sys.stdout.buffer)
+    finally:
+        server.rule_worker.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
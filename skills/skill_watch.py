@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Filesystem watchers used by `validate_skills.py --watch`.
+
+Uses inotify through ctypes on Linux (no pip installs needed) and falls back to
+stat polling elsewhere or when inotify is unavailable.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from lint_skill_policy import SKILL_ASSET_DIRS
+
+SKILL_FILENAME = "SKILL.md"
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_ROOT_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+_SKILL_MASK = IN_CLOSE_WRITE | IN_MODIFY | IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF
+# Asset directories only matter for which files exist, not for their contents.
+_ASSET_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Editors often save as truncate+write or write-temp+rename; wait briefly for
+# the burst to settle so each save triggers one revalidation.
+DEBOUNCE_SECONDS = 0.02
+
+
+class InotifyWatcher:
+    """Report skill directories whose SKILL.md or asset file set changed, plus root entry changes."""
+
+    kind = "inotify"
+
+    def __init__(self, root: Path, skill_dirs: list[Path]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._root = root
+        self._paths: dict[int, Path] = {}
+        self._watches: dict[Path, int] = {}
+        # Watch descriptor of an asset directory -> the skill directory that owns it.
+        self._owners: dict[int, Path] = {}
+        self._add_watch(root, _ROOT_MASK)
+        for skill_dir in skill_dirs:
+            self.add(skill_dir)
+
+    def _add_watch(self, path: Path, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {path}")
+        self._paths[wd] = path
+        self._watches[path] = wd
+        return wd
+
+    def _add_asset_watch(self, skill_dir: Path, name: str) -> None:
+        asset_dir = skill_dir / name
+        if asset_dir in self._watches or not asset_dir.is_dir():
+            return
+        try:
+            self._owners[self._add_watch(asset_dir, _ASSET_MASK)] = skill_dir
+        except OSError:
+            # Removed again before the watch landed; the skill directory event still fires.
+            pass
+
+    def _remove_watch(self, path: Path) -> None:
+        wd = self._watches.pop(path, None)
+        if wd is not None:
+            self._paths.pop(wd, None)
+            self._owners.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def add(self, skill_dir: Path) -> None:
+        if skill_dir not in self._watches:
+            self._add_watch(skill_dir, _SKILL_MASK)
+        for name in SKILL_ASSET_DIRS:
+            self._add_asset_watch(skill_dir, name)
+
+    def remove(self, skill_dir: Path) -> None:
+        self._remove_watch(skill_dir)
+        for name in SKILL_ASSET_DIRS:
+            self._remove_watch(skill_dir / name)
+
+    def _drain(self, changed: set[Path]) -> None:
+        try:
+            data = os.read(self._fd, 65536)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + name_len].rstrip(b"\0").decode("utf-8", "replace")
+            offset += name_len
+            path = self._paths.get(wd)
+            if path is None:
+                continue
+            if mask & IN_IGNORED:
+                self._paths.pop(wd, None)
+                self._watches.pop(path, None)
+                self._owners.pop(wd, None)
+                continue
+            if path == self._root:
+                if mask & IN_ISDIR:
+                    changed.add(self._root)
+            elif wd in self._owners:
+                changed.add(self._owners[wd])
+            elif name == SKILL_FILENAME or mask & IN_DELETE_SELF:
+                changed.add(path)
+            elif name in SKILL_ASSET_DIRS:
+                changed.add(path)
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_asset_watch(path, name)
+
+    def wait(self, timeout: float) -> set[Path]:
+        changed: set[Path] = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed
+        self._drain(changed)
+        while select.select([self._fd], [], [], DEBOUNCE_SECONDS)[0]:
+            self._drain(changed)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Stat-polling fallback with the same interface as InotifyWatcher."""
+
+    kind = "polling"
+
+    def __init__(self, root: Path, skill_dirs: list[Path], interval: float = 0.1) -> None:
+        self._root = root
+        self._interval = interval
+        self._root_signature = self._signature(root)
+        self._signatures: dict[Path, tuple[tuple[int, int] | None, ...]] = {}
+        for skill_dir in skill_dirs:
+            self.add(skill_dir)
+
+    @staticmethod
+    def _signature(path: Path) -> tuple[int, int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _skill_signature(self, skill_dir: Path) -> tuple[tuple[int, int] | None, ...]:
+        # Directory mtimes change when entries are added or removed, which covers
+        # asset files appearing or disappearing.
+        paths = [skill_dir / SKILL_FILENAME, skill_dir]
+        paths += [skill_dir / name for name in sorted(SKILL_ASSET_DIRS)]
+        return tuple(self._signature(path) for path in paths)
+
+    def add(self, skill_dir: Path) -> None:
+        if skill_dir not in self._signatures:
+            self._signatures[skill_dir] = self._skill_signature(skill_dir)
+
+    def remove(self, skill_dir: Path) -> None:
+        self._signatures.pop(skill_dir, None)
+
+    def wait(self, timeout: float) -> set[Path]:
+        deadline = time.monotonic() + timeout
+        while True:
+            changed: set[Path] = set()
+            # A directory's mtime changes when entries are added or removed.
+            root_signature = self._signature(self._root)
+            if root_signature != self._root_signature:
+                self._root_signature = root_signature
+                changed.add(self._root)
+            for skill_dir, previous in self._signatures.items():
+                current = self._skill_signature(skill_dir)
+                if current != previous:
+                    self._signatures[skill_dir] = current
+                    changed.add(skill_dir)
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self._interval, remaining))
+
+    def close(self) -> None:
+        pass
+
+
+def make_watcher(root: Path, skill_dirs: list[Path], force_polling: bool = False):
+    if not force_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root, skill_dirs)
+        except (OSError, AttributeError):
+            # No inotify symbols or watch limit reached; polling still works.
+            pass
+    return PollingWatcher(root, skill_dirs)
@@ -6,10 +6,43 @@ Runs policy lint plus quick frontmatter validation for each skill.
 """
 
 import argparse
+import hashlib
+import io
+import json
+import os
 import re
 import subprocess
 import sys
+import time
+from functools import partial
 from pathlib import Path
+from typing import Iterator
+
+from lint_skill_policy import (
+    DEFAULT_RULE_BUDGET_MS,
+    FORBIDDEN_PATTERNS,
+    REQUIRED_PATTERNS,
+    RULE_SELF_TEST_CACHE_FILENAME,
+    BoundedWorker,
+    RuleScanTimeout,
+    add_report_arguments,
+    default_jobs,
+    gate_rules,
+    lint_failure_messages,
+    lint_skill_content,
+    list_skill_files,
+    map_bounded,
+    map_skills,
+    positive_int,
+    report_lint_failures,
+    report_rule_scan_timeout,
+    report_self_test,
+    scan_skill_tree,
+    skill_scan_timeout_s,
+)
+from skill_dedupe import DEFAULT_DEDUPE_THRESHOLD, near_duplicate_clusters, similarity_threshold
+from skill_report import build_record, print_profile, write_report
+from skill_watch import make_watcher
 
 
 def repo_root_from_script() -> Path:
@@ -18,20 +51,7 @@ def repo_root_from_script() -> Path:
 
 
 def discover_skill_dirs(skills_root: Path, include_system: bool) -> list[Path]:
-    skill_dirs: list[Path] = []
-    for child in sorted(skills_root.iterdir()):
-        if not child.is_dir():
-            continue
-        if child.name.startswith(".") and not include_system:
-            continue
-        if (child / "SKILL.md").exists():
-            skill_dirs.append(child)
-    if include_system:
-        for system_skill in sorted(skills_root.glob(".system/*")):
-            if system_skill.is_dir() and (system_skill / "SKILL.md").exists():
-                if system_skill not in skill_dirs:
-                    skill_dirs.append(system_skill)
-    return skill_dirs
+    return list(scan_skill_tree(skills_root, include_system))
 
 
 def normalize_targets(targets: list[str]) -> list[Path]:
@@ -48,26 +68,106 @@ def normalize_targets(targets: list[str]) -> list[Path]:
     return sorted(set(normalized))
 
 
-def run(cmd: list[str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(cmd, text=True, capture_output=True)
+ZERO_REF = "0000000000000000000000000000000000000000"
+
+
+def git_lines(repo_root: Path, args: list[str]) -> list[str]:
+    completed = subprocess.run(
+        ["git", "-C", str(repo_root), *args],
+        text=True,
+        capture_output=True,
+        check=True,
+    )
+    return [line for line in completed.stdout.splitlines() if line]
+
+
+def changed_paths_since(repo_root: Path, ref: str) -> list[str]:
+    # Working tree against ref, plus untracked files so brand-new skills count.
+    changed = git_lines(repo_root, ["diff", "--name-only", ref])
+    changed += git_lines(repo_root, ["ls-files", "--others", "--exclude-standard"])
+    return changed
+
+
+def changed_paths_in_push_range(repo_root: Path, from_ref: str, to_ref: str) -> list[str]:
+    # Same range semantics as scripts/security/check-push-range.sh.
+    if not to_ref or to_ref == ZERO_REF:
+        return []
+    if not from_ref or from_ref == ZERO_REF:
+        return git_lines(repo_root, ["log", "--name-only", "--format=", to_ref, "--not", "--remotes"])
+    return git_lines(repo_root, ["diff", "--name-only", f"{from_ref}..{to_ref}"])
+
+
+def skill_targets_for_paths(
+    repo_root: Path, changed: list[str], include_system: bool
+) -> list[str] | None:
+    """Map repo-relative paths to their owning skill directories.
+
+    Any file inside a skill directory (SKILL.md, references/, scripts/,
+    agents/openai.yaml, ...) selects that skill. Returns None when a top-level
+    Python file under skills/ changed, since validator or rule changes affect
+    every skill.
+    """
+    targets: set[str] = set()
+    for raw in changed:
+        parts = Path(raw).parts
+        if len(parts) < 2 or parts[0] != "skills":
+            continue
+        if len(parts) == 2:
+            if parts[1].endswith(".py"):
+                return None
+            continue
+        if parts[1] == ".system":
+            if not include_system or len(parts) < 4:
+                continue
+            skill_dir = repo_root.joinpath(*parts[:3])
+        elif parts[1].startswith("."):
+            continue
+        else:
+            skill_dir = repo_root.joinpath(*parts[:2])
+        # Deleted skills have nothing left to validate.
+        if (skill_dir / "SKILL.md").exists():
+            targets.add(str(skill_dir))
+    return sorted(targets)
 
 
 ALLOWED_FRONTMATTER_KEYS = {"name", "description", "license", "allowed-tools", "metadata"}
 MAX_SKILL_NAME_LENGTH = 64
 MAX_DESCRIPTION_LENGTH = 1024
-
-
-def extract_frontmatter(content: str) -> str | None:
-    # Keep this intentionally simple and dependency-free so CI can run it without pip installs.
-    lines = content.splitlines()
-    if not lines:
-        return None
-    if lines[0].strip() != "---":
-        return None
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            return "\n".join(lines[1:i])
-    return None
+MAX_FRONTMATTER_BYTES = 64 * 1024
+DEFAULT_CACHE_FILENAME = ".validate_skills_cache.json"
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+
+
+def _collect_frontmatter(lines: Iterator[str], max_bytes: int) -> tuple[str | None, str]:
+    # Consume lines only up to the closing fence so callers can stream the file.
+    first = next(lines, "")
+    if not first.startswith("---"):
+        return None, "No YAML frontmatter found"
+    if first.strip() != "---":
+        return None, "Invalid frontmatter format"
+    inner: list[str] = []
+    size = -1
+    for line in lines:
+        line = line.rstrip("\n")
+        if line.strip() == "---":
+            return "\n".join(inner), ""
+        size += len(line.encode("utf-8")) + 1
+        if size > max_bytes:
+            return None, f"Frontmatter exceeds {max_bytes} bytes"
+        inner.append(line)
+    return None, "Invalid frontmatter format"
+
+
+def read_frontmatter(skill_md: Path, max_bytes: int = MAX_FRONTMATTER_BYTES) -> tuple[str | None, str]:
+    """Read only the frontmatter block of skill_md, never more than about max_bytes.
+
+    Returns (frontmatter_text, "") on success or (None, error_message).
+    """
+    with skill_md.open(encoding="utf-8") as handle:
+        # Bounding each readline keeps a huge single-line file from being loaded whole.
+        lines = iter(lambda: handle.readline(max_bytes + 8), "")
+        return _collect_frontmatter(lines, max_bytes)
 
 
 _TOP_LEVEL_KEY_RE = re.compile(r"^([A-Za-z0-9_-]+):(.*)$")
@@ -176,20 +276,95 @@ def parse_frontmatter_mapping(frontmatter_text: str) -> dict[str, object] | None
     return mapping or None
 
 
-def validate_skill_dir(skill_dir: Path) -> tuple[bool, str]:
+# Asset paths a SKILL.md names explicitly: references/*.md, scripts/<file>.<ext>
+# and agents/openai.yaml, either bare or prefixed with the skill's own directory
+# (for example `<path-to-skill>/scripts/x.py` or `$CODEX_HOME/skills/<name>/scripts/x.py`).
+# Prose such as "scripts/templates" has no extension and is not treated as a path,
+# and a bare path inside another path (`./scripts/deploy.sh`, `~/scripts/x.sh`,
+# `src/scripts/x.py`) points into the user's project, not the skill.
+_ASSET_REFERENCE_RE = re.compile(
+    r"(?:(?<![\w.-])(?P<owner><path-to-skill>|[\w-]+)/|(?<![\w./~-]))"
+    r"(?P<path>references/[\w.-]+\.md|scripts/[\w.-]+\.\w+|agents/openai\.yaml)\b"
+)
+
+
+def find_asset_references(content: str, skill_name: str) -> list[str]:
+    references: set[str] = set()
+    for match in _ASSET_REFERENCE_RE.finditer(content):
+        owner = match.group("owner")
+        if owner is None or owner in {"<path-to-skill>", skill_name}:
+            references.add(match.group("path"))
+    return sorted(references)
+
+
+def check_asset_references(
+    skill_dirs: list[Path],
+    results: list[dict[str, object]],
+    listings: dict[Path, frozenset[str]],
+) -> list[dict[str, object]]:
+    # Reference paths are cached with the content hash; existence is checked
+    # against the directory listing every run, so no extra filesystem calls.
+    checked: list[dict[str, object]] = []
+    for skill_dir, result in zip(skill_dirs, results):
+        files = listings.get(skill_dir, frozenset())
+        missing = [path for path in result.get("references") or [] if path not in files]
+        if result["valid"] and missing:
+            result = {
+                **result,
+                "valid": False,
+                "message": f"Referenced file(s) not found: {', '.join(missing)}",
+            }
+        checked.append(result)
+    return checked
+
+
+def read_skill_md(skill_dir: Path) -> str | None:
     skill_md = skill_dir / "SKILL.md"
     if not skill_md.exists():
-        return False, "SKILL.md not found"
+        return None
+    return skill_md.read_text(encoding="utf-8")
 
-    content = skill_md.read_text(encoding="utf-8")
-    if not content.startswith("---"):
-        return False, "No YAML frontmatter found"
 
-    frontmatter_text = extract_frontmatter(content)
+def validate_skill_dir(
+    skill_dir: Path, max_frontmatter_bytes: int = MAX_FRONTMATTER_BYTES
+) -> tuple[bool, str]:
+    skill_md = skill_dir / "SKILL.md"
+    if not skill_md.exists():
+        return False, "SKILL.md not found"
+    frontmatter_text, error = read_frontmatter(skill_md, max_frontmatter_bytes)
     if frontmatter_text is None:
-        return False, "Invalid frontmatter format"
+        return False, error
+    return validate_frontmatter_text(frontmatter_text)
+
+
+def validate_skill_content(
+    content: str, max_frontmatter_bytes: int = MAX_FRONTMATTER_BYTES
+) -> tuple[bool, str]:
+    valid, message, _ = check_skill_frontmatter(content, max_frontmatter_bytes)
+    return valid, message
 
+
+def check_skill_frontmatter(
+    content: str, max_frontmatter_bytes: int = MAX_FRONTMATTER_BYTES
+) -> tuple[bool, str, dict[str, object] | None]:
+    """Validate the frontmatter of SKILL.md content and also return its parsed mapping.
+
+    Lines are read lazily and only up to the closing fence, however large the body.
+    """
+    lines = io.StringIO(content, newline=None)
+    frontmatter_text, error = _collect_frontmatter(lines, max_frontmatter_bytes)
+    if frontmatter_text is None:
+        return False, error, None
     frontmatter = parse_frontmatter_mapping(frontmatter_text)
+    valid, message = validate_frontmatter(frontmatter)
+    return valid, message, frontmatter
+
+
+def validate_frontmatter_text(frontmatter_text: str) -> tuple[bool, str]:
+    return validate_frontmatter(parse_frontmatter_mapping(frontmatter_text))
+
+
+def validate_frontmatter(frontmatter: dict[str, object] | None) -> tuple[bool, str]:
     if not isinstance(frontmatter, dict):
         return False, "Frontmatter must be a YAML dictionary"
 
@@ -245,6 +420,264 @@ def validate_skill_dir(skill_dir: Path) -> tuple[bool, str]:
     return True, "Skill is valid!"
 
 
+def validator_fingerprint(max_frontmatter_bytes: int) -> str:
+    # Cached results are only reusable while the rules and the code that applies
+    # them are unchanged, so hash both the rule tables and the validator sources.
+    digest = hashlib.sha256()
+    rules = (
+        REQUIRED_PATTERNS,
+        FORBIDDEN_PATTERNS,
+        sorted(ALLOWED_FRONTMATTER_KEYS),
+        MAX_SKILL_NAME_LENGTH,
+        MAX_DESCRIPTION_LENGTH,
+        max_frontmatter_bytes,
+    )
+    digest.update(repr(rules).encode("utf-8"))
+    script = Path(__file__).resolve()
+    for source in (script, script.with_name("lint_skill_policy.py")):
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def load_cache(cache_file: Path, fingerprint: str) -> dict[str, dict[str, object]]:
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return {}
+    entries = data.get("skills")
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_cache(cache_file: Path, fingerprint: str, entries: dict[str, dict[str, object]]) -> None:
+    payload = {"fingerprint": fingerprint, "skills": entries}
+    tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+    try:
+        tmp_file.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # The cache is an optimization; read-only checkouts still validate fine.
+        pass
+
+
+def check_skill(
+    task: tuple[Path, dict[str, object] | None],
+    run_policy_lint: bool,
+    max_frontmatter_bytes: int = MAX_FRONTMATTER_BYTES,
+    collect_timings: bool = False,
+) -> dict[str, object]:
+    skill_dir, cached = task
+    started = time.perf_counter()
+    if not run_policy_lint:
+        # Frontmatter-only checks skip policy lint and the cache, but the body is
+        # still scanned so a skill naming a missing bundled file fails either way.
+        content = read_skill_md(skill_dir)
+        if content is None:
+            return {"sha256": None, "lint": None, "valid": False, "message": "SKILL.md not found"}
+        valid, message = validate_skill_content(content, max_frontmatter_bytes)
+        result = {
+            "sha256": None,
+            "lint": None,
+            "valid": valid,
+            "message": message,
+            "references": find_asset_references(content, skill_dir.name),
+        }
+        if collect_timings:
+            result["timings"] = {"frontmatter_s": time.perf_counter() - started}
+        return result
+    # Read SKILL.md once and share the content between policy lint and
+    # frontmatter validation.
+    content = read_skill_md(skill_dir)
+    read_s = time.perf_counter() - started
+    if content is None:
+        return {"sha256": None, "lint": None, "valid": False, "message": "SKILL.md not found"}
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    if cached is not None and cached.get("sha256") == digest and cached.get("lint") is not None:
+        if collect_timings:
+            return {**cached, "cached": True, "timings": {"read_s": read_s}}
+        return cached
+    rule_timings: dict[str, float] | None = {} if collect_timings else None
+    lint_result = lint_skill_content(content, rule_timings)
+    started = time.perf_counter()
+    valid, message, frontmatter = check_skill_frontmatter(content, max_frontmatter_bytes)
+    frontmatter_s = time.perf_counter() - started
+    result: dict[str, object] = {
+        "sha256": digest,
+        "lint": lint_result,
+        "valid": valid,
+        "message": message,
+        "references": find_asset_references(content, skill_dir.name),
+    }
+    if collect_timings:
+        result["timings"] = {"read_s": read_s, "frontmatter_s": frontmatter_s, "rules": rule_timings}
+    if valid:
+        # Keep the catalog fields alongside the cached result so the index can
+        # be rendered without re-reading any SKILL.md.
+        result["name"] = str(frontmatter["name"]).strip()
+        result["description"] = str(frontmatter["description"]).strip()
+    return result
+
+
+def render_skill_index(
+    skill_dirs: list[Path], results: list[dict[str, object]], repo_root: Path
+) -> str:
+    entries = []
+    for skill_dir, result in zip(skill_dirs, results):
+        lint = result["lint"]
+        if not result["valid"] or lint is None or lint[0] or lint[1]:
+            continue
+        entries.append(
+            {
+                "name": result["name"],
+                "description": result["description"],
+                "path": skill_dir.relative_to(repo_root).as_posix(),
+                "sha256": result["sha256"],
+            }
+        )
+    entries.sort(key=lambda entry: entry["path"])
+    return json.dumps({"version": INDEX_VERSION, "skills": entries}, indent=2) + "\n"
+
+
+def report_results(
+    skill_dirs: list[Path],
+    results: list[dict[str, object]],
+    repo_root: Path,
+    run_policy_lint: bool,
+) -> int:
+    if run_policy_lint:
+        lint_failures: list[tuple[Path, list[str], list[str]]] = []
+        for skill_dir, result in zip(skill_dirs, results):
+            if result["lint"] is None:
+                continue
+            missing, forbidden = result["lint"]
+            if missing or forbidden:
+                lint_failures.append((skill_dir / "SKILL.md", missing, forbidden))
+        lint_returncode = report_lint_failures(lint_failures, len(skill_dirs), repo_root)
+        if lint_returncode != 0:
+            return lint_returncode
+
+    failures: list[tuple[Path, str]] = []
+    for skill_dir, result in zip(skill_dirs, results):
+        if not result["valid"]:
+            failures.append((skill_dir, result["message"]))
+
+    if failures:
+        print(f"Skill validation failed: {len(failures)} skill(s).")
+        for path, message in sorted(failures):
+            rel = path.relative_to(repo_root)
+            print(f"- {rel}: {message}")
+        return 1
+
+    print(f"Skill validation passed for {len(skill_dirs)} skill(s).")
+    return 0
+
+
+def report_near_duplicates(
+    skill_dirs: list[Path],
+    results: list[dict[str, object]],
+    repo_root: Path,
+    threshold: float,
+) -> int:
+    # Only skills with valid frontmatter carry a name and description.
+    candidates = [
+        (skill_dir, f"{result['name']} {result['description']}")
+        for skill_dir, result in zip(skill_dirs, results)
+        if "name" in result
+    ]
+    clusters = near_duplicate_clusters([text for _, text in candidates], threshold)
+    if not clusters:
+        print(f"No near-duplicate skills at similarity >= {threshold:.2f} across {len(candidates)} skill(s).")
+        return 0
+    print(f"Near-duplicate skills: {len(clusters)} cluster(s) at similarity >= {threshold:.2f}.")
+    for members, low, high in clusters:
+        paths = ", ".join(str(candidates[index][0].relative_to(repo_root)) for index in members)
+        similarity = f"{low:.2f}" if low == high else f"{low:.2f}-{high:.2f}"
+        print(f"- {paths} (similarity {similarity})")
+    return 1
+
+
+def watch_skills(
+    skill_dirs: list[Path],
+    results: list[dict[str, object]],
+    listings: dict[Path, frozenset[str]],
+    args: argparse.Namespace,
+    skills_root: Path,
+    repo_root: Path,
+    full_run: bool,
+) -> int:
+    run_policy_lint = not args.skip_policy_lint
+    # known holds check_skill results; reported adds the asset reference check,
+    # which can change without SKILL.md changing when files are added or removed.
+    known = dict(zip(skill_dirs, results))
+    reported = dict(zip(skill_dirs, check_asset_references(skill_dirs, results, listings)))
+    watcher = make_watcher(skills_root, skill_dirs, force_polling=args.watch_polling)
+    # Rules are applied in a killable child, so one slow rule cannot stall the watch loop.
+    checker = BoundedWorker(
+        partial(
+            check_skill,
+            run_policy_lint=run_policy_lint,
+            max_frontmatter_bytes=args.max_frontmatter_bytes,
+        )
+    )
+    print(
+        f"Watching {len(known)} skill(s) for changes ({watcher.kind}). Press Ctrl-C to stop.",
+        flush=True,
+    )
+    try:
+        while True:
+            changed = watcher.wait(1.0)
+            if not changed:
+                continue
+            affected = changed - {skills_root}
+            if skills_root in changed and full_run:
+                discovered = set(discover_skill_dirs(skills_root, args.include_system))
+                affected |= discovered - known.keys()
+                affected |= known.keys() - discovered
+
+            removed = sorted(d for d in affected if d in known and not (d / "SKILL.md").exists())
+            for skill_dir in removed:
+                known.pop(skill_dir)
+                reported.pop(skill_dir, None)
+                watcher.remove(skill_dir)
+                print(f"- {skill_dir.relative_to(repo_root)}: removed from watch set", flush=True)
+
+            updated_dirs: list[Path] = []
+            updated_results: list[dict[str, object]] = []
+            for skill_dir in sorted(affected - set(removed)):
+                if not (skill_dir / "SKILL.md").exists():
+                    continue
+                watcher.add(skill_dir)
+                previous = known.get(skill_dir)
+                timeout_s = skill_scan_timeout_s(skill_dir / "SKILL.md", args.rule_budget_ms)
+                try:
+                    result = checker.call((skill_dir, previous), timeout_s)
+                except RuleScanTimeout:
+                    report_rule_scan_timeout(skill_dir / "SKILL.md", timeout_s, repo_root)
+                    sys.stdout.flush()
+                    continue
+                listing = {skill_dir: list_skill_files(skill_dir)}
+                [checked] = check_asset_references([skill_dir], [result], listing)
+                # check_skill hands back the previous result when the content hash is unchanged.
+                if result == previous and checked == reported.get(skill_dir):
+                    continue
+                known[skill_dir] = result
+                reported[skill_dir] = checked
+                updated_dirs.append(skill_dir)
+                updated_results.append(checked)
+
+            if updated_dirs:
+                stamp = time.strftime("%H:%M:%S")
+                print(f"[{stamp}] Revalidated {len(updated_dirs)} changed skill(s).")
+                report_results(updated_dirs, updated_results, repo_root, run_policy_lint)
+                sys.stdout.flush()
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        checker.close()
+        watcher.close()
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Run policy lint and quick validation for skills."
@@ -254,58 +687,242 @@ def main() -> int:
         nargs="*",
         help="Optional skill directories or SKILL.md files. Defaults to all versioned skills.",
     )
+    parser.add_argument(
+        "--skills-root",
+        type=Path,
+        help="Skills directory to discover skills in. Defaults to this repo's skills/.",
+    )
     parser.add_argument(
         "--include-system",
         action="store_true",
         help="Include skills under skills/.system/*.",
     )
+    selection = parser.add_mutually_exclusive_group()
+    selection.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="Validate only skills with files changed since REF (including uncommitted and untracked files).",
+    )
+    selection.add_argument(
+        "--push-range",
+        action="store_true",
+        help="Validate only skills changed in the PRE_COMMIT_FROM_REF..PRE_COMMIT_TO_REF pre-push range.",
+    )
     parser.add_argument(
         "--skip-policy-lint",
         action="store_true",
         help="Skip policy lint and only run quick_validate on targets.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=default_jobs(),
+        help="Number of worker processes. Defaults to the CPU count.",
+    )
+    parser.add_argument(
+        "--max-frontmatter-bytes",
+        type=positive_int,
+        default=MAX_FRONTMATTER_BYTES,
+        help=f"Fail skills whose frontmatter exceeds this many bytes (default: {MAX_FRONTMATTER_BYTES}).",
+    )
+    parser.add_argument(
+        "--rule-budget-ms",
+        type=positive_int,
+        default=DEFAULT_RULE_BUDGET_MS,
+        help=(
+            "Per-rule time budget for the pathological-input self-test that runs whenever "
+            f"the policy rules change (default: {DEFAULT_RULE_BUDGET_MS})."
+        ),
+    )
+    parser.add_argument(
+        "--cache-file",
+        type=Path,
+        help=f"Result cache location. Defaults to skills/{DEFAULT_CACHE_FILENAME}.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Revalidate every skill and re-run the rule self-test, leaving both caches untouched.",
+    )
+    index_mode = parser.add_mutually_exclusive_group()
+    index_mode.add_argument(
+        "--write-index",
+        action="store_true",
+        help=f"Write skills/{INDEX_FILENAME}, a catalog of every skill that passes validation.",
+    )
+    index_mode.add_argument(
+        "--check-index",
+        action="store_true",
+        help=f"Fail when skills/{INDEX_FILENAME} does not match the current skills.",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Report clusters of skills whose name and description are near-duplicates.",
+    )
+    parser.add_argument(
+        "--dedupe-threshold",
+        type=similarity_threshold,
+        default=DEFAULT_DEDUPE_THRESHOLD,
+        help=(
+            "Jaccard similarity of name+description shingles at which --dedupe reports "
+            f"skills as near-duplicates (default: {DEFAULT_DEDUPE_THRESHOLD})."
+        ),
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After the initial run, keep watching skills and revalidate each one as it changes.",
+    )
+    parser.add_argument(
+        "--watch-polling",
+        action="store_true",
+        help="In --watch mode, poll file stats instead of using inotify (e.g. network filesystems).",
+    )
+    add_report_arguments(parser)
     args = parser.parse_args()
+    if args.report and not args.report_file:
+        parser.error("--report requires --report-file")
+    if args.targets and (args.changed_since or args.push_range):
+        parser.error("targets cannot be combined with --changed-since or --push-range")
+    if args.write_index or args.check_index:
+        if args.targets or args.changed_since or args.push_range:
+            parser.error("the skill index covers every skill; do not select targets")
+        if args.skip_policy_lint:
+            parser.error("the skill index only lists skills that pass policy lint")
+    if args.dedupe and args.skip_policy_lint:
+        parser.error("--dedupe reads names and descriptions from full validation runs")
 
     repo_root = repo_root_from_script()
     skills_root = repo_root / "skills"
-    lint_script = skills_root / "lint_skill_policy.py"
+    if args.skills_root:
+        skills_root = args.skills_root.expanduser().resolve()
+        repo_root = skills_root.parent
+    cache_file = args.cache_file or skills_root / DEFAULT_CACHE_FILENAME
 
-    if args.targets:
-        skill_dirs = normalize_targets(args.targets)
+    targets: list[str] | None = args.targets or None
+    if args.changed_since or args.push_range:
+        try:
+            if args.changed_since:
+                changed = changed_paths_since(repo_root, args.changed_since)
+            else:
+                changed = changed_paths_in_push_range(
+                    repo_root,
+                    os.environ.get("PRE_COMMIT_FROM_REF", ""),
+                    os.environ.get("PRE_COMMIT_TO_REF", ""),
+                )
+        except subprocess.CalledProcessError as error:
+            print(f"Could not list changed files: {error.stderr.strip()}", file=sys.stderr)
+            return 1
+        targets = skill_targets_for_paths(repo_root, changed, args.include_system)
+        if targets == []:
+            print("No changed skills to validate.")
+            return 0
+
+    full_run = targets is None
+    if targets:
+        listings = {skill_dir: list_skill_files(skill_dir) for skill_dir in normalize_targets(targets)}
     else:
-        skill_dirs = discover_skill_dirs(skills_root, args.include_system)
+        listings = scan_skill_tree(skills_root, args.include_system)
+    skill_dirs = list(listings)
 
     if not skill_dirs:
         print("No skills found to validate.")
         return 1
 
-    if not args.skip_policy_lint:
-        lint_cmd = [sys.executable, str(lint_script)]
-        lint_cmd.extend(str(p) for p in skill_dirs)
-        lint_result = run(lint_cmd)
-        if lint_result.stdout:
-            print(lint_result.stdout, end="")
-        if lint_result.stderr:
-            print(lint_result.stderr, end="", file=sys.stderr)
-        if lint_result.returncode != 0:
-            return lint_result.returncode
-
-    failures: list[tuple[Path, str]] = []
-    for skill_dir in skill_dirs:
-        valid, message = validate_skill_dir(skill_dir)
-        if not valid:
-            failures.append((skill_dir, message))
-
-    if failures:
-        print(f"Skill validation failed: {len(failures)} skill(s).")
-        for path, message in failures:
-            rel = path.relative_to(repo_root)
-            print(f"- {rel}: {message}")
-        return 1
-
-    print(f"Skill validation passed for {len(skill_dirs)} skill(s).")
-    return 0
+    fingerprint = ""
+    cache: dict[str, dict[str, object]] = {}
+    # Only lint runs hash full content; frontmatter-only runs stream and skip the cache.
+    use_cache = not args.no_cache and not args.skip_policy_lint
+    if use_cache:
+        fingerprint = validator_fingerprint(args.max_frontmatter_bytes)
+        cache = load_cache(cache_file, fingerprint)
 
+    if not args.skip_policy_lint:
+        # Rules are vetted against pathological input before they touch any skill;
+        # the pass is shared with lint_skill_policy.py and the server.
+        rules_cache = None if args.no_cache else skills_root / RULE_SELF_TEST_CACHE_FILENAME
+        failed_self_test = gate_rules(args.rule_budget_ms, rules_cache)
+        if failed_self_test is not None:
+            return report_self_test(failed_self_test, args.rule_budget_ms)
+
+    check = partial(
+        check_skill,
+        run_policy_lint=not args.skip_policy_lint,
+        max_frontmatter_bytes=args.max_frontmatter_bytes,
+        collect_timings=bool(args.report or args.profile),
+    )
+    tasks = [(skill_dir, cache.get(str(skill_dir))) for skill_dir in skill_dirs]
+    if args.skip_policy_lint:
+        results = map_skills(check, tasks, args.jobs)
+    else:
+        # Even self-tested rules get a deadline on real content, so none can hang the run.
+        try:
+            results = map_bounded(
+                check,
+                tasks,
+                args.jobs,
+                lambda task: skill_scan_timeout_s(task[0] / "SKILL.md", args.rule_budget_ms),
+            )
+        except RuleScanTimeout as error:
+            return report_rule_scan_timeout(error.item[0] / "SKILL.md", error.timeout_s, repo_root)
+
+    if use_cache:
+        if full_run:
+            # A full run knows the complete skill set; drop entries for removed skills.
+            cache = {}
+        for skill_dir, result in zip(skill_dirs, results):
+            if result["sha256"] is not None:
+                cache[str(skill_dir)] = {
+                    key: value for key, value in result.items() if key not in ("cached", "timings")
+                }
+        save_cache(cache_file, fingerprint, cache)
+
+    unchecked_results = results
+    results = check_asset_references(skill_dirs, results, listings)
+    returncode = report_results(skill_dirs, results, repo_root, not args.skip_policy_lint)
+    if args.report or args.profile:
+        records = []
+        for skill_dir, result in zip(skill_dirs, results):
+            failures = lint_failure_messages(*result["lint"]) if result["lint"] else []
+            if not result["valid"]:
+                failures.append(str(result["message"]))
+            records.append(
+                build_record(
+                    skill_dir.relative_to(repo_root).as_posix(),
+                    failures,
+                    result.get("timings"),
+                    cached=bool(result.get("cached")),
+                )
+            )
+        if args.report:
+            write_report(args.report, args.report_file, "validate_skills", records)
+        if args.profile:
+            print_profile(records)
+    if args.write_index or args.check_index:
+        index_file = skills_root / INDEX_FILENAME
+        index_text = render_skill_index(skill_dirs, results, repo_root)
+        if args.write_index:
+            index_file.write_text(index_text, encoding="utf-8")
+            print(f"Wrote {index_file.relative_to(repo_root)}.")
+        else:
+            try:
+                current_text = index_file.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                current_text = None
+            if current_text != index_text:
+                print(
+                    f"Skill index is stale: {index_file.relative_to(repo_root)}. "
+                    "Run validate_skills.py --write-index."
+                )
+                returncode = 1
+    if args.dedupe:
+        returncode = report_near_duplicates(skill_dirs, results, repo_root, args.dedupe_threshold) or returncode
+    if args.watch:
+        return watch_skills(
+            skill_dirs, unchecked_results, listings, args, skills_root, repo_root, full_run
+        )
+    return returncode
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Compare per-attempt check overhead across poll_until_done.py exec modes."""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable
+
+from poll_until_done import (
+    EXEC_MODES,
+    PersistentShell,
+    _positive_int,
+    _run_check_argv,
+    _run_check_command,
+)
+
+
+def _time_attempts(
+    run_check: Callable[[str], tuple[int, str]], check_cmd: str, attempts: int
+) -> list[float]:
+    # One untimed warm-up so the persistent shell's start-up is not counted
+    # against its per-attempt cost.
+    run_check(check_cmd)
+    samples = []
+    for _ in range(attempts):
+        started = time.perf_counter()
+        exit_code, output = run_check(check_cmd)
+        samples.append(time.perf_counter() - started)
+        if exit_code != 0:
+            raise RuntimeError(f"check exited {exit_code}: {output}")
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare per-attempt check overhead across exec modes."
+    )
+    parser.add_argument(
+        "--check-cmd",
+        default="test -e /",
+        help="Check command to time; must exit 0 and run in every mode (default: test -e /)",
+    )
+    parser.add_argument(
+        "--attempts",
+        type=_positive_int,
+        default=50,
+        help="Timed attempts per mode (default: 50)",
+    )
+    args = parser.parse_args()
+
+    print(f"check_cmd={args.check_cmd} attempts={args.attempts}")
+    print(f"{'mode':<18} {'mean_ms':>9} {'p50_ms':>9} {'p95_ms':>9} {'speedup':>8}")
+    baseline_ms = None
+    for mode in EXEC_MODES:
+        shell = PersistentShell() if mode == "persistent-shell" else None
+        try:
+            if shell is not None:
+                run_check = shell.run
+            elif mode == "direct":
+                run_check = _run_check_argv
+            else:
+                run_check = _run_check_command
+            samples = sorted(_time_attempts(run_check, args.check_cmd, args.attempts))
+        finally:
+            if shell is not None:
+                shell.close()
+        mean_ms = statistics.fmean(samples) * 1000
+        p50_ms = samples[len(samples) // 2] * 1000
+        p95_ms = samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000
+        if baseline_ms is None:
+            baseline_ms = mean_ms
+        print(
+            f"{mode:<18} {mean_ms:>9.2f} {p50_ms:>9.2f} {p95_ms:>9.2f} "
+            f"{baseline_ms / mean_ms:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,18 +1,77 @@
 #!/usr/bin/env python3
-"""Poll a shell command until completion or failure."""
+"""Poll one or more shell commands until completion or failure."""
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import os
+import random
 import re
+import secrets
+import select
+import shlex
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
 import time
 from datetime import datetime, timezone
-from typing import Pattern
+from functools import partial
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from typing import Callable, Iterator, Pattern
+from urllib.parse import urlsplit
 
 FATAL_EXIT_CODES = {126, 127}
 MAX_TIMEOUT_SECONDS = 8 * 60 * 60
+SCHEDULES = ("fixed", "backoff")
+RETRYABLE_STATUSES = ("pending", "attempt_timeout")
+EXEC_MODES = ("login-shell", "direct", "persistent-shell")
+DEFAULT_MAX_OUTPUT_BYTES = 1024 * 1024
+MAX_KEPT_MATCH_LINES = 20
+# Reported when a check is stopped at its deadline, matching timeout(1).
+ATTEMPT_TIMEOUT_EXIT_CODE = 124
+KILL_GRACE_SECONDS = 2.0
+SLURM_SUCCESS_STATES = ("COMPLETED",)
+SLURM_FAILURE_STATES = (
+    "FAILED", "CANCELLED", "TIMEOUT", "NODE_FAIL", "OUT_OF_MEMORY",
+    "BOOT_FAIL", "DEADLINE", "PREEMPTED", "REVOKED",
+)
+# Reported for --check-url attempts that get no HTTP response (curl's "couldn't connect").
+HTTP_CONNECT_ERROR_EXIT_CODE = 7
+STATE_VERSION = 1
+EVENT_FORMATS = ("jsonl",)
+METRICS_FORMATS = ("prometheus", "json")
+# Check-latency histogram buckets in seconds, from local commands to slow cluster CLIs.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# How often --follow-file checks a quiet log for new data or rotation.
+FOLLOW_POLL_SECONDS = 0.05
+DEFAULT_STAT_INTERVAL_SECONDS = 1.0
+DEFAULT_ON_CHANGE_TIMEOUT_SECONDS = 30.0
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+_WAIT_PATH_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+)
+# inotify only sees changes made through this kernel, so sentinels written by
+# other hosts onto these filesystems are detected by stat polling instead.
+NETWORK_FS_TYPES = frozenset(
+    {"nfs", "nfs4", "cifs", "smb3", "smbfs", "afs", "9p", "ceph", "lustre", "gpfs", "beegfs", "glusterfs"}
+)
 
 
 def _positive_int(value: str) -> int:
@@ -29,6 +88,90 @@ def _non_negative_int(value: str) -> int:
     return parsed_value
 
 
+def _positive_float(value: str) -> float:
+    parsed_value = float(value)
+    if parsed_value <= 0:
+        raise argparse.ArgumentTypeError("value must be > 0")
+    return parsed_value
+
+
+def _backoff_factor(value: str) -> float:
+    parsed_value = float(value)
+    if parsed_value < 1:
+        raise argparse.ArgumentTypeError("value must be >= 1")
+    return parsed_value
+
+
+def _jitter_ratio(value: str) -> float:
+    parsed_value = float(value)
+    if not 0 <= parsed_value < 1:
+        raise argparse.ArgumentTypeError("value must be >= 0 and < 1")
+    return parsed_value
+
+
+def _completion_policy(value: str) -> tuple[str, int]:
+    if value in ("all", "any"):
+        return value, 0
+    name, _, count = value.partition("=")
+    if name == "quorum" and count.isdigit() and int(count) > 0:
+        return name, int(count)
+    raise argparse.ArgumentTypeError("expected all, any, or quorum=N with N > 0")
+
+
+def _http_header(value: str) -> tuple[str, str]:
+    name, separator, header_value = value.partition(":")
+    if not separator or not name.strip():
+        raise argparse.ArgumentTypeError("header must look like 'Name: value'")
+    return name.strip(), header_value.strip()
+
+
+def _json_path(value: str) -> tuple[str | int, ...]:
+    # Dotted keys with [N] or [*] indexes, optionally prefixed with "$".
+    path = value[1:] if value.startswith("$") else value
+    steps: list[str | int] = []
+    position = 0
+    for match in re.finditer(r"\.?([^.\[\]]+)|\[(\d+|\*)\]", path):
+        if match.start() != position:
+            break
+        key, index = match.groups()
+        if key is not None:
+            steps.append(key)
+        else:
+            steps.append(index if index == "*" else int(index))
+        position = match.end()
+    if position != len(path) or not steps:
+        raise argparse.ArgumentTypeError(
+            "expected a path like status.state, items[0].phase, or conditions[*].type"
+        )
+    return tuple(steps)
+
+
+def _metrics_label(value: str) -> tuple[str, str]:
+    name, separator, label_value = value.partition("=")
+    if not separator or not re.fullmatch(r"[a-zA-Z_][a-zA-Z0-9_]*", name):
+        raise argparse.ArgumentTypeError("label must look like name=value")
+    return name, label_value
+
+
+def _slurm_job_ids(value: str) -> list[str]:
+    job_ids = [job_id for job_id in re.split(r"[,\s]+", value) if job_id]
+    for job_id in job_ids:
+        if not re.fullmatch(r"\d+(_\d+)?", job_id):
+            raise argparse.ArgumentTypeError(
+                f"invalid Slurm job ID {job_id!r}; expected JOBID or JOBID_TASK"
+            )
+    if not job_ids:
+        raise argparse.ArgumentTypeError("expected at least one Slurm job ID")
+    return job_ids
+
+
+def _slurm_states(value: str) -> tuple[str, ...]:
+    states = tuple(state.strip().upper() for state in value.split(",") if state.strip())
+    if not states:
+        raise argparse.ArgumentTypeError("expected a comma-separated list of Slurm states")
+    return states
+
+
 def _bounded_timeout_seconds(value: str) -> int:
     parsed_value = int(value)
     if parsed_value <= 0:
@@ -47,20 +190,450 @@ def _compile_regex(pattern: str, label: str) -> Pattern[str]:
         raise ValueError(f"invalid {label}: {error}") from error
 
 
-def _run_check_command(check_cmd: str) -> tuple[int, str]:
-    completed = subprocess.run(
+def _combine_output(stdout: str, stderr: str) -> str:
+    output_parts = []
+    if stdout:
+        output_parts.append(stdout.strip())
+    if stderr:
+        output_parts.append(stderr.strip())
+    return "\n".join(part for part in output_parts if part).strip()
+
+
+def _decode_output(data: bytes) -> str:
+    # Same newline handling as text=True, so `$`-anchored patterns keep working on \r\n output.
+    return data.decode("utf-8", "replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+class BoundedCapture:
+    """Keep the last `limit` bytes of a stream as it is read.
+
+    Older data is evicted a whole line at a time. Before it is dropped it is
+    searched with the success/failure regexes, and matching lines (up to
+    MAX_KEPT_MATCH_LINES, each kept once) are kept ahead of the tail, so a match
+    is not lost just because the check printed a lot after it. The last line of
+    each evicted chunk is searched again with the next one, so a match that spans
+    the eviction boundary is still found.
+    """
+
+    def __init__(self, limit: int, patterns: list[Pattern[str]] | tuple = ()) -> None:
+        self._limit = limit
+        self._patterns = list(patterns)
+        self._buffer = bytearray()
+        # Kept lines by their start offset in the evicted text, so a line matched
+        # by several patterns (or again once completed) is kept only once.
+        self._kept: dict[int, str] = {}
+        self._carry = ""
+        self._carry_offset = 0
+
+    def feed(self, chunk: bytes) -> None:
+        self._buffer += chunk
+        # Evict in batches once the buffer doubles, so trimming stays amortized O(1).
+        if len(self._buffer) > 2 * self._limit:
+            self._evict(len(self._buffer) - self._limit)
+
+    def _evict(self, count: int) -> None:
+        newline = self._buffer.find(b"\n", count - 1)
+        end = newline + 1 if newline != -1 else count
+        evicted = _decode_output(bytes(self._buffer[:end]))
+        del self._buffer[:end]
+        searched = self._carry + evicted
+        carried = len(self._carry)
+        for pattern in self._patterns:
+            for match in pattern.finditer(searched):
+                if match.end() <= carried:
+                    # Entirely inside the carried line: found by the previous search.
+                    continue
+                start = searched.rfind("\n", 0, match.start()) + 1
+                stop = searched.find("\n", match.end())
+                key = self._carry_offset + start
+                if key not in self._kept and len(self._kept) >= MAX_KEPT_MATCH_LINES:
+                    break
+                self._kept[key] = searched[start : stop if stop != -1 else len(searched)]
+        if carried and self._carry_offset in self._kept:
+            # A kept line that was cut mid-line is now complete.
+            stop = searched.find("\n")
+            self._kept[self._carry_offset] = searched[: stop if stop != -1 else len(searched)]
+        # A runaway line without newlines carries only its last `limit` characters.
+        tail = max(searched.rfind("\n", 0, len(searched) - 1) + 1, len(searched) - self._limit)
+        self._carry = searched[tail:]
+        self._carry_offset += tail
+
+    def text(self) -> str:
+        if len(self._buffer) > self._limit:
+            self._evict(len(self._buffer) - self._limit)
+        kept = [self._kept[key] for key in sorted(self._kept)]
+        return "\n".join(kept + [_decode_output(bytes(self._buffer))])
+
+
+def _stop_process_group(process: subprocess.Popen) -> None:
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            break
+        if sig == signal.SIGTERM:
+            try:
+                process.wait(timeout=KILL_GRACE_SECONDS)
+            except subprocess.TimeoutExpired:
+                pass
+    process.wait()
+
+
+def _output_fingerprint(exit_code: int, output: str) -> tuple[int, bytes]:
+    # A digest instead of the output itself keeps the comparison cheap to hold
+    # across an 8-hour wait, whatever --max-output-bytes allows.
+    digest = hashlib.blake2b(output.encode("utf-8", "surrogateescape"), digest_size=16)
+    return exit_code, digest.digest()
+
+
+def _hook_deadline(args: argparse.Namespace, start_time: float) -> float:
+    return min(
+        time.monotonic() + args.on_change_timeout,
+        start_time + args.timeout_seconds,
+    )
+
+
+def _run_hook(
+    hook_cmd: str, output: str, env: dict[str, str], deadline: Callable[[], float]
+) -> None:
+    # The check output goes to stdin, since it can exceed the size of one
+    # environment variable. Hook output is passed through to ours.
+    process = subprocess.Popen(
+        ["/bin/sh", "-c", hook_cmd],
+        stdin=subprocess.PIPE,
+        env={**os.environ, **env},
+        start_new_session=True,
+    )
+    try:
+        process.communicate(
+            output.encode("utf-8", "surrogateescape"),
+            timeout=max(0.1, deadline() - time.monotonic()),
+        )
+    except subprocess.TimeoutExpired:
+        _stop_process_group(process)
+        print("--on-change hook stopped after --on-change-timeout", flush=True)
+        return
+    except BaseException:
+        _stop_process_group(process)
+        raise
+    if process.returncode != 0:
+        # A broken hook is reported but never changes the wait's outcome.
+        print(f"--on-change hook exited {process.returncode}", flush=True)
+
+
+def _collect_output(
+    process: subprocess.Popen,
+    deadline: float | None,
+    max_output_bytes: int,
+    patterns: list[Pattern[str]] | tuple,
+) -> tuple[int, str]:
+    captures = {
+        process.stdout.fileno(): BoundedCapture(max_output_bytes, patterns),
+        process.stderr.fileno(): BoundedCapture(max_output_bytes, patterns),
+    }
+    stdout_capture, stderr_capture = captures.values()
+    open_fds = list(captures)
+    timed_out = False
+    try:
+        while open_fds:
+            timeout = None
+            if deadline is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    timed_out = True
+                    break
+            ready, _, _ = select.select(open_fds, [], [], timeout)
+            for fd in ready:
+                chunk = os.read(fd, 65536)
+                if chunk:
+                    captures[fd].feed(chunk)
+                else:
+                    open_fds.remove(fd)
+        if not timed_out:
+            try:
+                process.wait(
+                    timeout=None if deadline is None else max(0.0, deadline - time.monotonic())
+                )
+            except subprocess.TimeoutExpired:
+                timed_out = True
+    except BaseException:
+        # The check runs in its own session, so Ctrl-C does not reach it.
+        _stop_process_group(process)
+        raise
+    finally:
+        process.stdout.close()
+        process.stderr.close()
+    if timed_out:
+        _stop_process_group(process)
+    output = _combine_output(stdout_capture.text(), stderr_capture.text())
+    return (ATTEMPT_TIMEOUT_EXIT_CODE if timed_out else process.returncode), output
+
+
+def _run_check_command(
+    check_cmd: str,
+    deadline: float | None = None,
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    patterns: list[Pattern[str]] | tuple = (),
+) -> tuple[int, str]:
+    # Each check gets its own process group so a deadline can stop everything it
+    # started, not just the shell.
+    process = subprocess.Popen(
         ["/bin/sh", "-lc", check_cmd],
-        capture_output=True,
-        text=True,
-        check=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
     )
-    output_parts = []
-    if completed.stdout:
-        output_parts.append(completed.stdout.strip())
-    if completed.stderr:
-        output_parts.append(completed.stderr.strip())
-    combined_output = "\n".join(part for part in output_parts if part).strip()
-    return completed.returncode, combined_output
+    return _collect_output(process, deadline, max_output_bytes, patterns)
+
+
+def _run_check_argv(
+    check_cmd: str,
+    deadline: float | None = None,
+    max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+    patterns: list[Pattern[str]] | tuple = (),
+) -> tuple[int, str]:
+    # No shell: the command is split like a shell word list and exec'd directly.
+    # Missing or non-executable programs map to the shell's 127/126 exit codes.
+    try:
+        process = subprocess.Popen(
+            shlex.split(check_cmd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+    except FileNotFoundError as error:
+        return 127, str(error)
+    except PermissionError as error:
+        return 126, str(error)
+    return _collect_output(process, deadline, max_output_bytes, patterns)
+
+
+def _json_path_values(document: object, path: tuple[str | int, ...]) -> list[object]:
+    current = [document]
+    for step in path:
+        found: list[object] = []
+        for item in current:
+            if step == "*":
+                if isinstance(item, list):
+                    found.extend(item)
+                elif isinstance(item, dict):
+                    found.extend(item.values())
+            elif isinstance(step, int):
+                if isinstance(item, list) and -len(item) <= step < len(item):
+                    found.append(item[step])
+            elif isinstance(item, dict) and step in item:
+                found.append(item[step])
+        current = found
+    return current
+
+
+class HttpChecker:
+    """Run --check-url attempts over one reused keep-alive connection.
+
+    A 2xx response counts as exit code 0, and its ETag/Last-Modified are sent back
+    as If-None-Match/If-Modified-Since. A 304 replays the previous result
+    without transferring a body. Other responses report the HTTP status as the
+    exit code, and connection errors report HTTP_CONNECT_ERROR_EXIT_CODE.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: list[tuple[str, str]],
+        json_path: tuple[str | int, ...] | None,
+    ) -> None:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"--check-url must be an http:// or https:// URL: {url}")
+        if parts.username is not None:
+            # The URL is printed and logged each attempt; keep secrets out of it.
+            raise ValueError("pass credentials with --header 'Authorization: ...', not in --check-url")
+        self._url = url
+        self._connection_class = HTTPSConnection if parts.scheme == "https" else HTTPConnection
+        self._host = parts.netloc
+        self._target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self._headers = dict(headers)
+        self._json_path = json_path
+        self._connection: HTTPConnection | None = None
+        self._validators: dict[str, str] = {}
+        self._last_result: tuple[int, str] | None = None
+
+    def _get(
+        self, timeout: float | None, capture: BoundedCapture
+    ) -> tuple[int, str, dict[str, str]]:
+        if self._connection is None:
+            self._connection = self._connection_class(self._host, timeout=timeout)
+        elif self._connection.sock is not None:
+            self._connection.sock.settimeout(timeout)
+        else:
+            self._connection.timeout = timeout
+        self._connection.request("GET", self._target, headers={**self._headers, **self._validators})
+        response = self._connection.getresponse()
+        # The body is always drained so the connection can be reused.
+        while chunk := response.read(65536):
+            capture.feed(chunk)
+        validators = {}
+        if response.getheader("ETag"):
+            validators["If-None-Match"] = response.getheader("ETag")
+        if response.getheader("Last-Modified"):
+            validators["If-Modified-Since"] = response.getheader("Last-Modified")
+        return response.status, response.reason, validators
+
+    def run(
+        self,
+        check_cmd: str,
+        deadline: float | None = None,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+        patterns: list[Pattern[str]] = (),
+    ) -> tuple[int, str]:
+        while True:
+            reused = self._connection is not None
+            # With --json-path the body is parsed whole, so no lines are set aside.
+            capture = BoundedCapture(max_output_bytes, () if self._json_path else patterns)
+            timeout = None if deadline is None else max(0.001, deadline - time.monotonic())
+            try:
+                status, reason, validators = self._get(timeout, capture)
+                break
+            except TimeoutError:
+                self.close()
+                return ATTEMPT_TIMEOUT_EXIT_CODE, f"no response from {self._url} before the attempt deadline"
+            except (HTTPException, OSError) as error:
+                self.close()
+                # Servers drop idle keep-alive connections between polls; retry
+                # once on a fresh connection before reporting an error.
+                if reused:
+                    continue
+                return HTTP_CONNECT_ERROR_EXIT_CODE, f"{type(error).__name__}: {error}"
+
+        if status == 304 and self._last_result is not None:
+            return self._last_result
+        text = capture.text()
+        if not 200 <= status < 300:
+            return status, f"HTTP {status} {reason}\n{text}".strip()
+        self._validators = validators
+        if self._json_path is not None:
+            try:
+                values = _json_path_values(json.loads(text), self._json_path)
+            except ValueError:
+                # Not (yet) JSON, or cut short by --max-output-bytes: nothing to match.
+                values = []
+            text = "\n".join(
+                value if isinstance(value, str) else json.dumps(value) for value in values
+            )
+        self._last_result = (0, text)
+        return self._last_result
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class PersistentShell:
+    """One warm `/bin/sh -l` that runs each check in a subshell.
+
+    The profile is read once. Each check runs as `( eval CMD )` so `exit`, `cd`,
+    or variable changes in a check do not leak into later checks, and its
+    stdout/stderr go to scratch files so output cannot be confused with the
+    completion marker the shell prints afterwards. The shell has its own process
+    group; a check that overruns its deadline is stopped together with the shell,
+    and a fresh shell is started for the next attempt.
+    """
+
+    def __init__(self) -> None:
+        self._scratch_dir = tempfile.mkdtemp(prefix="poll-until-done-")
+        self._stdout_path = os.path.join(self._scratch_dir, "stdout")
+        self._stderr_path = os.path.join(self._scratch_dir, "stderr")
+        self._marker = f"__poll_until_done_{secrets.token_hex(8)}__".encode("ascii")
+        self._process: subprocess.Popen | None = None
+
+    def _start(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["/bin/sh", "-l"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+    def _read_scratch(
+        self, path: str, max_output_bytes: int, patterns: list[Pattern[str]] | tuple
+    ) -> str:
+        capture = BoundedCapture(max_output_bytes, patterns)
+        with open(path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(65536), b""):
+                capture.feed(chunk)
+        return capture.text()
+
+    def _wait_for_marker(self, deadline: float | None) -> int | None:
+        fd = self._process.stdout.fileno()
+        buffer = b""
+        while True:
+            timeout = None
+            if deadline is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    raise TimeoutError
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if not ready:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return None
+            buffer += chunk
+            # Anything else on stdout (profile banners) is ignored.
+            for line in buffer.split(b"\n")[:-1]:
+                if line.startswith(self._marker):
+                    return int(line.split()[1])
+            buffer = buffer[buffer.rfind(b"\n") + 1 :]
+
+    def run(
+        self,
+        check_cmd: str,
+        deadline: float | None = None,
+        max_output_bytes: int = DEFAULT_MAX_OUTPUT_BYTES,
+        patterns: list[Pattern[str]] | tuple = (),
+    ) -> tuple[int, str]:
+        script = (
+            f"( eval {shlex.quote(check_cmd)} ) </dev/null "
+            f">{shlex.quote(self._stdout_path)} 2>{shlex.quote(self._stderr_path)}; "
+            f'echo "{self._marker.decode("ascii")} $?"\n'
+        ).encode("utf-8")
+        # If the shell died (for example a check killed its parent), start a new
+        # one and retry once.
+        for _ in range(2):
+            if self._process is None or self._process.poll() is not None:
+                self._process = self._start()
+            try:
+                self._process.stdin.write(script)
+                self._process.stdin.flush()
+                exit_code = self._wait_for_marker(deadline)
+            except BrokenPipeError:
+                exit_code = None
+            except TimeoutError:
+                _stop_process_group(self._process)
+                self._process = None
+                exit_code = ATTEMPT_TIMEOUT_EXIT_CODE
+            except BaseException:
+                _stop_process_group(self._process)
+                self._process = None
+                raise
+            if exit_code is not None:
+                return exit_code, _combine_output(
+                    self._read_scratch(self._stdout_path, max_output_bytes, patterns),
+                    self._read_scratch(self._stderr_path, max_output_bytes, patterns),
+                )
+            self._process = None
+        return 127, "persistent shell exited before the check finished"
+
+    def close(self) -> None:
+        if self._process is not None and self._process.poll() is None:
+            self._process.stdin.close()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                _stop_process_group(self._process)
+        shutil.rmtree(self._scratch_dir, ignore_errors=True)
 
 
 def _utc_timestamp() -> str:
@@ -91,10 +664,276 @@ def _print_attempt(
         print(f"  output={_compact_output(output)}", flush=True)
 
 
+class PollMetrics:
+    """Per-wait metrics written once on exit (--metrics).
+
+    Check latency comes from attempts that ran a check. Time spent checking is
+    the wall-clock time of each polling round, so concurrent checks are not
+    counted twice and idle time stays meaningful. The detection window is the time between the last check that saw a job
+    unfinished and the check that saw it complete: the upper bound on how late
+    completion was noticed. Event-driven modes (--follow-*, --wait-path) only
+    count statuses.
+    """
+
+    def __init__(self, labels: list[tuple[str, str]]) -> None:
+        self.labels = dict(labels)
+        self.latencies: list[float] = []
+        self.check_time_s = 0.0
+        self.statuses: dict[str, int] = {}
+        self.detection_window_s: float | None = None
+        self._last_check_end: dict[object, float] = {}
+
+    def observe(self, fields: dict[str, object], start_time: float) -> None:
+        status = fields.get("status")
+        if status is not None:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+        if fields.get("latency_s") is not None:
+            self.latencies.append(float(fields["latency_s"]))
+        if "attempt" not in fields:
+            # Event-driven modes have no checks to measure a detection window against.
+            return
+        now = time.monotonic()
+        job = fields.get("job")
+        if status == "completed":
+            # A resumed wait has no earlier check on record; count from the start.
+            self.detection_window_s = now - self._last_check_end.get(job, start_time)
+        self._last_check_end[job] = now
+
+    def observe_round(self, seconds: float) -> None:
+        self.check_time_s += seconds
+
+    def summary(self, exit_code: int, total_wait_s: float) -> dict[str, object]:
+        latencies = sorted(self.latencies)
+        check_time_s = self.check_time_s
+
+        def percentile(fraction: float) -> float | None:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * fraction))], 6)
+
+        return {
+            "labels": self.labels,
+            "exit_code": exit_code,
+            "finished_at": _utc_timestamp(),
+            "total_wait_s": round(total_wait_s, 6),
+            "check_time_s": round(check_time_s, 6),
+            "idle_time_s": round(max(0.0, total_wait_s - check_time_s), 6),
+            "detection_window_s": (
+                None if self.detection_window_s is None else round(self.detection_window_s, 6)
+            ),
+            "attempts_by_status": dict(sorted(self.statuses.items())),
+            "check_latency_s": {
+                "count": len(latencies),
+                "sum": round(sum(latencies), 6),
+                "min": round(latencies[0], 6) if latencies else None,
+                "p50": percentile(0.5),
+                "p95": percentile(0.95),
+                "max": round(latencies[-1], 6) if latencies else None,
+                "buckets": {
+                    f"{bound:g}": sum(1 for latency in latencies if latency <= bound)
+                    for bound in LATENCY_BUCKETS
+                },
+            },
+        }
+
+
+def _prometheus_labels(labels: dict[str, str], **extra: str) -> str:
+    merged = {**labels, **extra}
+    if not merged:
+        return ""
+    pairs = []
+    for name, value in merged.items():
+        value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _render_prometheus(summary: dict[str, object]) -> str:
+    labels = summary["labels"]
+    latency = summary["check_latency_s"]
+    prefix = "wait_for_job"
+    lines = [
+        f"# HELP {prefix}_check_latency_seconds Duration of each status check.",
+        f"# TYPE {prefix}_check_latency_seconds histogram",
+    ]
+    for bound, count in latency["buckets"].items():
+        lines.append(
+            f"{prefix}_check_latency_seconds_bucket{_prometheus_labels(labels, le=bound)} {count}"
+        )
+    lines += [
+        f"{prefix}_check_latency_seconds_bucket{_prometheus_labels(labels, le='+Inf')} {latency['count']}",
+        f"{prefix}_check_latency_seconds_sum{_prometheus_labels(labels)} {latency['sum']}",
+        f"{prefix}_check_latency_seconds_count{_prometheus_labels(labels)} {latency['count']}",
+        f"# HELP {prefix}_attempts_total Checks by classified status.",
+        f"# TYPE {prefix}_attempts_total counter",
+    ]
+    for status, count in summary["attempts_by_status"].items():
+        lines.append(f"{prefix}_attempts_total{_prometheus_labels(labels, status=status)} {count}")
+    gauges = [
+        ("wait_seconds", "Wall-clock time from the start of the wait to exit.", summary["total_wait_s"]),
+        ("check_seconds", "Wall-clock time spent in status-check rounds.", summary["check_time_s"]),
+        (
+            "detection_window_seconds",
+            "Time between the last check that saw the job unfinished and the one that saw it complete.",
+            summary["detection_window_s"],
+        ),
+        ("exit_code", "Exit code of the wait (0 done, 1 timeout, 2 failure, 130 interrupted).", summary["exit_code"]),
+        ("finished_timestamp_seconds", "Unix time the wait exited.", round(time.time(), 3)),
+    ]
+    for name, help_text, value in gauges:
+        if value is None:
+            continue
+        lines += [
+            f"# HELP {prefix}_{name} {help_text}",
+            f"# TYPE {prefix}_{name} gauge",
+            f"{prefix}_{name}{_prometheus_labels(labels)} {value}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _write_atomic(path: str, text: str) -> None:
+    # Readers such as the node_exporter textfile collector never see a partial file.
+    tmp_file = f"{path}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as handle:
+        handle.write(text)
+    os.replace(tmp_file, path)
+
+
+class PollRecorder:
+    """Resumable progress (--state-file) and per-attempt records (--events-file).
+
+    The state file keeps the wall-clock start, attempt count, and last status so a
+    poller restarted after an interruption resumes under the original timeout
+    and --max-attempts budget. It is removed once the wait ends with 0, 1, or 2,
+    and ignored when it was written for different check commands.
+    """
+
+    def __init__(
+        self,
+        state_file: str | None,
+        events_file: str | None,
+        key: list[str],
+        quiet: bool,
+        metrics: PollMetrics | None = None,
+        metrics_format: str | None = None,
+        metrics_file: str | None = None,
+    ) -> None:
+        self.state_file = state_file
+        self.key = key
+        self.metrics = metrics
+        self.metrics_format = metrics_format
+        self.metrics_file = metrics_file
+        self.started_at = time.time()
+        self.attempt = 0
+        self.job_statuses: list[str] | None = None
+        state = self._load() if state_file else None
+        if state is not None:
+            self.started_at = float(state["started_at"])
+            self.attempt = int(state["attempt"])
+            self.job_statuses = state.get("job_statuses")
+            if not quiet:
+                print(
+                    f"resuming from {state_file}: attempt={self.attempt} "
+                    f"elapsed={int(time.time() - self.started_at)}s "
+                    f"last_status={state.get('last_status')}",
+                    flush=True,
+                )
+        # Monotonic equivalent of the (possibly earlier) wall-clock start.
+        self.start_time = time.monotonic() - max(0.0, time.time() - self.started_at)
+        self._events = open(events_file, "a", encoding="utf-8") if events_file else None
+
+    def _load(self) -> dict[str, object] | None:
+        try:
+            with open(self.state_file, encoding="utf-8") as handle:
+                state = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # A damaged state file should not block the wait; start over.
+            return None
+        if not isinstance(state, dict) or state.get("version") != STATE_VERSION:
+            return None
+        if state.get("key") != self.key:
+            return None
+        return state
+
+    def save(self, attempt: int, status: str, job_statuses: list[str] | None = None) -> None:
+        if not self.state_file:
+            return
+        state = {
+            "version": STATE_VERSION,
+            "key": self.key,
+            "started_at": self.started_at,
+            "attempt": attempt,
+            "last_status": status,
+            "updated_at": time.time(),
+        }
+        if job_statuses is not None:
+            state["job_statuses"] = job_statuses
+        _write_atomic(self.state_file, json.dumps(state))
+
+    def check_round(self, seconds: float) -> None:
+        # Wall-clock time of one polling round, however many checks ran in it.
+        if self.metrics is not None:
+            self.metrics.observe_round(seconds)
+
+    def event(self, **fields: object) -> None:
+        if self.metrics is not None:
+            self.metrics.observe(fields, self.start_time)
+        if self._events is None:
+            return
+        record = {
+            "ts": _utc_timestamp(),
+            "elapsed_s": round(time.monotonic() - self.start_time, 3),
+            **fields,
+        }
+        self._events.write(json.dumps(record) + "\n")
+        self._events.flush()
+
+    def finish(self) -> None:
+        if self.state_file:
+            try:
+                os.remove(self.state_file)
+            except FileNotFoundError:
+                pass
+
+    def close(self, exit_code: int) -> None:
+        if self._events is not None:
+            self._events.close()
+        if self.metrics is not None and self.metrics_file:
+            summary = self.metrics.summary(exit_code, time.monotonic() - self.start_time)
+            if self.metrics_format == "prometheus":
+                text = _render_prometheus(summary)
+            else:
+                text = json.dumps(summary, indent=2) + "\n"
+            _write_atomic(self.metrics_file, text)
+
+
+def _budget_spent(args: argparse.Namespace, start_time: float, attempt: int) -> str | None:
+    if args.max_attempts and attempt >= args.max_attempts:
+        return "max attempts reached"
+    if _timed_out(start_time, args.timeout_seconds):
+        return "timeout reached"
+    return None
+
+
 def _timed_out(start_time: float, timeout_seconds: int) -> bool:
     return time.monotonic() - start_time >= timeout_seconds
 
 
+def _poll_delays(args: argparse.Namespace, rng: random.Random) -> Iterator[float]:
+    if args.schedule == "fixed":
+        while True:
+            yield args.interval_seconds
+    # Backoff: start fast so short jobs are caught quickly, then grow toward the
+    # --interval-seconds ceiling. Jitter only shortens a delay, so the ceiling holds
+    # and pollers that started together drift apart instead of hitting in lockstep.
+    delay = min(args.min_interval_seconds, args.interval_seconds)
+    while True:
+        yield delay * (1 - args.jitter_ratio * rng.random())
+        delay = min(delay * args.backoff_factor, args.interval_seconds)
+
+
 def _matches_any(patterns: list[Pattern[str]], text: str) -> bool:
     return any(pattern.search(text) for pattern in patterns)
 
@@ -108,8 +947,217 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--check-cmd",
-        required=True,
-        help="Shell command used to check task status",
+        action="append",
+        default=[],
+        help=(
+            "Shell command used to check task status. Repeat to wait on several "
+            "jobs concurrently in one process"
+        ),
+    )
+    parser.add_argument(
+        "--check-cmd-file",
+        help="File with one check command per line (blank lines and # comments ignored)",
+    )
+    follow = parser.add_mutually_exclusive_group()
+    follow.add_argument(
+        "--wait-path",
+        action="append",
+        default=[],
+        help=(
+            "Instead of polling, wait for this sentinel file (for example _SUCCESS) to "
+            "appear, using inotify with a stat-polling fallback. Repeatable; combined "
+            "with --completion. With --success-regex/--failure-regex, its contents are matched"
+        ),
+    )
+    follow.add_argument(
+        "--check-url",
+        help=(
+            "Instead of a check command, GET this http(s) URL each attempt over one "
+            "keep-alive connection, with conditional requests (a 304 means no change). "
+            "2xx counts as success; the regexes match the body"
+        ),
+    )
+    follow.add_argument(
+        "--follow-file",
+        help=(
+            "Instead of polling, tail this log file (from the start, following "
+            "rotation) and apply the regexes to each line as it is written"
+        ),
+    )
+    follow.add_argument(
+        "--follow-cmd",
+        help=(
+            "Instead of polling, run this long-running shell command once (for example "
+            "`kubectl logs -f`) and apply the regexes to each output line. Without "
+            "--success-regex, completion is the command exiting 0"
+        ),
+    )
+    follow.add_argument(
+        "--slurm-jobs",
+        type=_slurm_job_ids,
+        action="append",
+        default=[],
+        help=(
+            "Instead of a check command, wait on these Slurm job IDs (comma-separated, "
+            "repeatable; JOBID or JOBID_TASK) with one squeue call per round for all "
+            "of them, plus one sacct call for jobs squeue no longer lists"
+        ),
+    )
+    parser.add_argument(
+        "--slurm-success-states",
+        type=_slurm_states,
+        default=SLURM_SUCCESS_STATES,
+        help=f"With --slurm-jobs: states that complete a job (default: {','.join(SLURM_SUCCESS_STATES)})",
+    )
+    parser.add_argument(
+        "--slurm-failure-states",
+        type=_slurm_states,
+        default=SLURM_FAILURE_STATES,
+        help=f"With --slurm-jobs: states that fail a job (default: {','.join(SLURM_FAILURE_STATES)})",
+    )
+    parser.add_argument(
+        "--slurm-prefix",
+        help=(
+            "With --slurm-jobs: command prefix for squeue/sacct, for example 'ssh login1' "
+            "when the Slurm tools are only available on a login node"
+        ),
+    )
+    parser.add_argument(
+        "--header",
+        type=_http_header,
+        action="append",
+        default=[],
+        help="With --check-url: extra request header as 'Name: value'. Repeatable",
+    )
+    parser.add_argument(
+        "--json-path",
+        type=_json_path,
+        help=(
+            "With --check-url: match the regexes against this field of the JSON body "
+            "(for example status.state or conditions[*].type) instead of the whole body"
+        ),
+    )
+    parser.add_argument(
+        "--failure-path",
+        action="append",
+        default=[],
+        help="With --wait-path: exit 2 as soon as this file (for example FAILED) exists. Repeatable",
+    )
+    parser.add_argument(
+        "--wait-path-polling",
+        action="store_true",
+        help=(
+            "With --wait-path: poll file stats instead of using inotify. Chosen automatically "
+            "on network and FUSE filesystems"
+        ),
+    )
+    parser.add_argument(
+        "--stat-interval-seconds",
+        type=_positive_float,
+        default=DEFAULT_STAT_INTERVAL_SECONDS,
+        help=(
+            "With --wait-path stat polling: seconds between checks "
+            f"(default: {DEFAULT_STAT_INTERVAL_SECONDS:g})"
+        ),
+    )
+    parser.add_argument(
+        "--completion",
+        type=_completion_policy,
+        default=("all", 0),
+        help=(
+            "With several check commands or --wait-path files: finish when all jobs complete (all), "
+            "when any job completes (any), or when N jobs complete (quorum=N). "
+            "Default: all"
+        ),
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=16,
+        help="Maximum check commands running at once (default: 16)",
+    )
+    parser.add_argument(
+        "--attempt-timeout",
+        type=_positive_float,
+        help=(
+            "Stop a check (its whole process group) after this many seconds and "
+            "retry on the next attempt. Checks never run past --timeout-seconds "
+            "either way"
+        ),
+    )
+    parser.add_argument(
+        "--max-output-bytes",
+        type=_positive_int,
+        default=DEFAULT_MAX_OUTPUT_BYTES,
+        help=(
+            "Keep at most this many trailing bytes of each check's stdout and stderr. "
+            "Earlier lines matching --success-regex/--failure-regex are kept too "
+            f"(default: {DEFAULT_MAX_OUTPUT_BYTES})"
+        ),
+    )
+    parser.add_argument(
+        "--on-change",
+        help=(
+            "Shell command run on the first attempt and whenever a check's exit code or "
+            "output changes. The output is passed on stdin; POLL_ATTEMPT, POLL_STATUS, "
+            "POLL_EXIT_CODE, POLL_CHECK_CMD, and (with several jobs) POLL_JOB are set"
+        ),
+    )
+    parser.add_argument(
+        "--on-change-timeout",
+        type=_positive_float,
+        default=DEFAULT_ON_CHANGE_TIMEOUT_SECONDS,
+        help=(
+            "Stop an --on-change hook, with its process group, after this many seconds "
+            f"(default: {DEFAULT_ON_CHANGE_TIMEOUT_SECONDS:g})"
+        ),
+    )
+    parser.add_argument(
+        "--state-file",
+        help=(
+            "Save the start time, attempt count, and last status here after every attempt "
+            "and resume from it on restart, so the timeout and --max-attempts budgets "
+            "survive an interrupted poller. Removed once the wait finishes"
+        ),
+    )
+    parser.add_argument(
+        "--events",
+        choices=EVENT_FORMATS,
+        help="Write one record per attempt (latency, exit code, status) to --events-file",
+    )
+    parser.add_argument(
+        "--events-file",
+        help="Events output path, appended to (required with --events)",
+    )
+    parser.add_argument(
+        "--metrics",
+        choices=METRICS_FORMATS,
+        help=(
+            "On exit, write check-latency histogram, attempts by status, detection window, "
+            "and total wait time to --metrics-file as a Prometheus textfile or JSON summary"
+        ),
+    )
+    parser.add_argument(
+        "--metrics-file",
+        help="Metrics output path, replaced atomically (required with --metrics)",
+    )
+    parser.add_argument(
+        "--metrics-label",
+        type=_metrics_label,
+        action="append",
+        default=[],
+        help="Label added to every metric as name=value, to tell waits apart. Repeatable",
+    )
+    parser.add_argument(
+        "--exec-mode",
+        choices=EXEC_MODES,
+        default="login-shell",
+        help=(
+            "How check commands run. login-shell: `/bin/sh -lc CMD` per attempt. "
+            "direct: split CMD into argv and exec it without a shell (no pipes, "
+            "globs, or $VARS). persistent-shell: keep one login shell warm and run "
+            "each check in a subshell of it (default: login-shell)"
+        ),
     )
     parser.add_argument(
         "--success-regex",
@@ -128,7 +1176,41 @@ def _build_parser() -> argparse.ArgumentParser:
         "--interval-seconds",
         type=_positive_int,
         default=120,
-        help="Polling interval in seconds (default: 120)",
+        help=(
+            "Polling interval in seconds; with --schedule backoff, the ceiling "
+            "the interval grows to (default: 120)"
+        ),
+    )
+    parser.add_argument(
+        "--schedule",
+        choices=SCHEDULES,
+        default="fixed",
+        help=(
+            "fixed: wait --interval-seconds between checks. "
+            "backoff: start at --min-interval-seconds and multiply by --backoff-factor "
+            "up to --interval-seconds, with random jitter (default: fixed)"
+        ),
+    )
+    parser.add_argument(
+        "--min-interval-seconds",
+        type=_positive_float,
+        default=5.0,
+        help="First delay for --schedule backoff (default: 5)",
+    )
+    parser.add_argument(
+        "--backoff-factor",
+        type=_backoff_factor,
+        default=2.0,
+        help="Delay multiplier per attempt for --schedule backoff (default: 2)",
+    )
+    parser.add_argument(
+        "--jitter-ratio",
+        type=_jitter_ratio,
+        default=0.2,
+        help=(
+            "For --schedule backoff, shorten each delay by a random fraction up to "
+            "this ratio (default: 0.2)"
+        ),
     )
     parser.add_argument(
         "--timeout-seconds",
@@ -161,7 +1243,47 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def run_poll_loop(args: argparse.Namespace) -> int:
+def _classify_attempt(
+    exit_code: int,
+    output: str,
+    success_pattern: Pattern[str] | None,
+    failure_patterns: list[Pattern[str]],
+    retry_on_nonzero: bool,
+) -> str:
+    if output and _matches_any(failure_patterns, output):
+        return "failure_pattern_matched"
+    if success_pattern is not None and output and success_pattern.search(output):
+        return "completed"
+    if exit_code == ATTEMPT_TIMEOUT_EXIT_CODE:
+        # Stopped at its deadline: retry on the next attempt.
+        return "attempt_timeout"
+    if success_pattern is None:
+        if exit_code == 0:
+            return "completed"
+        if exit_code in FATAL_EXIT_CODES:
+            return "fatal_command_error"
+        return "pending"
+    if exit_code != 0 and not retry_on_nonzero:
+        if exit_code in FATAL_EXIT_CODES:
+            return "fatal_command_error"
+        return "nonzero_exit_in_regex_mode"
+    return "pending"
+
+
+def _failure_message(status: str, exit_code: int, regex_mode: bool) -> str:
+    if status == "failure_pattern_matched":
+        return "terminal failure pattern detected"
+    if regex_mode:
+        return (
+            "check command exited non-zero in regex mode; "
+            "use --retry-on-nonzero to keep polling"
+        )
+    return f"fatal check command error (exit code {exit_code})"
+
+
+def _compile_patterns(
+    args: argparse.Namespace,
+) -> tuple[Pattern[str] | None, list[Pattern[str]]]:
     success_pattern: Pattern[str] | None = None
     if args.success_regex:
         success_pattern = _compile_regex(args.success_regex, "--success-regex")
@@ -170,109 +1292,982 @@ def run_poll_loop(args: argparse.Namespace) -> int:
         _compile_regex(pattern, "--failure-regex")
         for pattern in args.failure_regex
     ]
+    return success_pattern, failure_patterns
+
+
+def _sleep_seconds(args: argparse.Namespace, start_time: float, delay: float) -> float:
+    # Never sleep past the deadline; the last check runs at the timeout.
+    remaining = args.timeout_seconds - (time.monotonic() - start_time)
+    return max(0.0, min(delay, remaining))
 
-    start_time = time.monotonic()
-    attempt = 0
+
+def _attempt_deadline(args: argparse.Namespace, start_time: float) -> float:
+    # A check may not outlive the overall timeout, nor --attempt-timeout if set.
+    deadline = start_time + args.timeout_seconds
+    if args.attempt_timeout:
+        deadline = min(deadline, time.monotonic() + args.attempt_timeout)
+    return deadline
+
+
+def run_poll_loop(args: argparse.Namespace, recorder: PollRecorder) -> int:
+    if args.check_url:
+        checker = HttpChecker(args.check_url, args.header, args.json_path)
+        try:
+            return _poll_single(args, recorder, checker.run)
+        finally:
+            checker.close()
+    if args.exec_mode == "persistent-shell":
+        shell = PersistentShell()
+        try:
+            return _poll_single(args, recorder, shell.run)
+        finally:
+            shell.close()
+    if args.exec_mode == "direct":
+        return _poll_single(args, recorder, _run_check_argv)
+    return _poll_single(args, recorder, _run_check_command)
+
+
+def _poll_single(
+    args: argparse.Namespace,
+    recorder: PollRecorder,
+    run_check: Callable[..., tuple[int, str]],
+) -> int:
+    success_pattern, failure_patterns = _compile_patterns(args)
+    watched_patterns = failure_patterns + ([success_pattern] if success_pattern else [])
+    start_time = recorder.start_time
+    attempt = recorder.attempt
+    delays = _poll_delays(args, random.Random())
+    fingerprint = None
+    status = "pending"
+    if attempt:
+        # Resumed after an interruption: the saved budget may already be spent.
+        spent = _budget_spent(args, start_time, attempt)
+        if spent:
+            print(spent, flush=True)
+            return 1
 
     while True:
         attempt += 1
-        exit_code, output = _run_check_command(args.check_cmd)
-
-        if output and _matches_any(failure_patterns, output):
+        started = time.monotonic()
+        exit_code, output = run_check(
+            args.check_cmd[0],
+            _attempt_deadline(args, start_time),
+            args.max_output_bytes,
+            watched_patterns,
+        )
+        latency_s = time.monotonic() - started
+        recorder.check_round(latency_s)
+        # Identical output and exit code classify the same way, so repeats skip
+        # the regexes, the log line, and the --on-change hook.
+        previous_fingerprint, fingerprint = fingerprint, _output_fingerprint(exit_code, output)
+        changed = fingerprint != previous_fingerprint
+        if changed:
+            status = _classify_attempt(
+                exit_code,
+                output,
+                success_pattern,
+                failure_patterns,
+                args.retry_on_nonzero,
+            )
+        recorder.event(
+            attempt=attempt,
+            check_cmd=args.check_cmd[0],
+            latency_s=round(latency_s, 6),
+            exit_code=exit_code,
+            status=status,
+            changed=changed,
+        )
+        recorder.save(attempt, status)
+        if changed:
             _print_attempt(
                 attempt=attempt,
                 exit_code=exit_code,
-                status="failure_pattern_matched",
+                status=status,
                 output=output,
                 quiet=args.quiet,
             )
-            print("terminal failure pattern detected", flush=True)
+            if args.on_change:
+                _run_hook(
+                    args.on_change,
+                    output,
+                    {
+                        "POLL_ATTEMPT": str(attempt),
+                        "POLL_STATUS": status,
+                        "POLL_EXIT_CODE": str(exit_code),
+                        "POLL_CHECK_CMD": args.check_cmd[0],
+                    },
+                    partial(_hook_deadline, args, start_time),
+                )
+        if status == "completed":
+            print("task completed", flush=True)
+            return 0
+        if status not in RETRYABLE_STATUSES:
+            print(
+                _failure_message(status, exit_code, success_pattern is not None),
+                flush=True,
+            )
             return 2
 
-        if success_pattern is None:
-            if exit_code == 0:
-                _print_attempt(
-                    attempt=attempt,
-                    exit_code=exit_code,
-                    status="completed",
-                    output=output,
-                    quiet=args.quiet,
+        if args.max_attempts and attempt >= args.max_attempts:
+            print("max attempts reached", flush=True)
+            return 1
+        if _timed_out(start_time, args.timeout_seconds):
+            print("timeout reached", flush=True)
+            return 1
+
+        time.sleep(_sleep_seconds(args, start_time, next(delays)))
+
+
+def _read_check_cmd_file(path: str) -> list[str]:
+    try:
+        with open(path, encoding="utf-8") as handle:
+            lines = [line.strip() for line in handle]
+    except OSError as error:
+        raise ValueError(f"cannot read --check-cmd-file: {error}") from error
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def _policy_outcome(
+    policy: tuple[str, int], total: int, completed: int, failed: int
+) -> int | None:
+    # Returns 0 once the policy is met, 2 once it can no longer be met, else None.
+    name, quorum = policy
+    needed = {"all": total, "any": 1, "quorum": quorum}[name]
+    if completed >= needed:
+        return 0
+    if total - failed < needed:
+        return 2
+    return None
+
+
+async def _stop_process_group_async(process: asyncio.subprocess.Process) -> None:
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            break
+        if sig == signal.SIGTERM:
+            try:
+                await asyncio.wait_for(process.wait(), KILL_GRACE_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+    await process.wait()
+
+
+async def _run_check_command_async(
+    check_cmd: str,
+    semaphore: asyncio.Semaphore,
+    exec_mode: str,
+    attempt_deadline: Callable[[], float],
+    max_output_bytes: int,
+    patterns: list[Pattern[str]],
+) -> tuple[int, str, float]:
+    if exec_mode == "direct":
+        argv = shlex.split(check_cmd)
+    else:
+        argv = ["/bin/sh", "-lc", check_cmd]
+    stdout_capture = BoundedCapture(max_output_bytes, patterns)
+    stderr_capture = BoundedCapture(max_output_bytes, patterns)
+
+    async def pump(stream: asyncio.StreamReader, capture: BoundedCapture) -> None:
+        while chunk := await stream.read(65536):
+            capture.feed(chunk)
+
+    async with semaphore:
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+            )
+        except FileNotFoundError as error:
+            return 127, str(error), 0.0
+        except PermissionError as error:
+            return 126, str(error), 0.0
+        # The deadline starts once the check runs, not while it waits for a slot.
+        started = time.monotonic()
+        deadline = attempt_deadline()
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    pump(process.stdout, stdout_capture),
+                    pump(process.stderr, stderr_capture),
+                    process.wait(),
+                ),
+                max(0.0, deadline - time.monotonic()),
+            )
+            exit_code = process.returncode
+        except asyncio.TimeoutError:
+            await _stop_process_group_async(process)
+            exit_code = ATTEMPT_TIMEOUT_EXIT_CODE
+        except BaseException:
+            await _stop_process_group_async(process)
+            raise
+        latency_s = time.monotonic() - started
+    output = _combine_output(stdout_capture.text(), stderr_capture.text())
+    return exit_code, output, latency_s
+
+
+def _print_job_status(
+    job: int,
+    attempt: int,
+    exit_code: int,
+    status: str,
+    output: str,
+    quiet: bool,
+) -> None:
+    if quiet:
+        return
+    print(
+        f"[{_utc_timestamp()}] job={job} attempt={attempt} "
+        f"exit_code={exit_code} status={status}",
+        flush=True,
+    )
+    if output:
+        print(f"  output={_compact_output(output)}", flush=True)
+
+
+async def _poll_jobs(
+    args: argparse.Namespace, check_cmds: list[str], recorder: PollRecorder
+) -> int:
+    success_pattern, failure_patterns = _compile_patterns(args)
+    watched_patterns = failure_patterns + ([success_pattern] if success_pattern else [])
+    semaphore = asyncio.Semaphore(args.concurrency)
+    total = len(check_cmds)
+    statuses = list(recorder.job_statuses or ["pending"] * total)
+    # Only state transitions are printed, so dozens of jobs stay readable.
+    last_reported: list[tuple[str, int] | None] = [None] * total
+    fingerprints: list[tuple[int, bytes] | None] = [None] * total
+    start_time = recorder.start_time
+    attempt = recorder.attempt
+    delays = _poll_delays(args, random.Random())
+
+    if not args.quiet:
+        for job, check_cmd in enumerate(check_cmds, start=1):
+            print(f"job={job} check_cmd={check_cmd}", flush=True)
+    if attempt:
+        # Resumed after an interruption: the saved budget may already be spent.
+        spent = _budget_spent(args, start_time, attempt)
+        if spent:
+            print(f"{spent} ({statuses.count('completed')}/{total} completed)", flush=True)
+            return 1
+
+    hook_tasks: set[asyncio.Task] = set()
+    hook_locks = [asyncio.Lock() for _ in range(total)]
+
+    async def run_hook(job: int, output: str, env: dict[str, str]) -> None:
+        async with hook_locks[job]:
+            await asyncio.to_thread(
+                _run_hook, args.on_change, output, env, partial(_hook_deadline, args, start_time)
+            )
+
+    async def check(job: int) -> None:
+        exit_code, output, latency_s = await _run_check_command_async(
+            check_cmds[job],
+            semaphore,
+            args.exec_mode,
+            partial(_attempt_deadline, args, start_time),
+            args.max_output_bytes,
+            watched_patterns,
+        )
+        fingerprint = _output_fingerprint(exit_code, output)
+        changed = fingerprint != fingerprints[job]
+        fingerprints[job] = fingerprint
+        if changed:
+            statuses[job] = _classify_attempt(
+                exit_code,
+                output,
+                success_pattern,
+                failure_patterns,
+                args.retry_on_nonzero,
+            )
+        status = statuses[job]
+        recorder.event(
+            attempt=attempt,
+            job=job + 1,
+            check_cmd=check_cmds[job],
+            latency_s=round(latency_s, 6),
+            exit_code=exit_code,
+            status=status,
+            changed=changed,
+        )
+        if last_reported[job] != (status, exit_code):
+            last_reported[job] = (status, exit_code)
+            _print_job_status(job + 1, attempt, exit_code, status, output, args.quiet)
+        if changed and args.on_change:
+            # Not awaited here, so a slow hook never delays the round; the
+            # per-job lock keeps one job's hooks in order.
+            task = asyncio.create_task(
+                run_hook(
+                    job,
+                    output,
+                    {
+                        "POLL_ATTEMPT": str(attempt),
+                        "POLL_STATUS": status,
+                        "POLL_EXIT_CODE": str(exit_code),
+                        "POLL_CHECK_CMD": check_cmds[job],
+                        "POLL_JOB": str(job + 1),
+                    },
                 )
-                print("task completed", flush=True)
+            )
+            hook_tasks.add(task)
+            task.add_done_callback(hook_tasks.discard)
+        if status != "completed" and status not in RETRYABLE_STATUSES and not args.quiet:
+            print(
+                f"job={job + 1} "
+                f"{_failure_message(status, exit_code, success_pattern is not None)}",
+                flush=True,
+            )
+
+    try:
+        while True:
+            attempt += 1
+            pending = [job for job in range(total) if statuses[job] in RETRYABLE_STATUSES]
+            # Jobs report as they finish, so one slow check does not hold back the others.
+            round_started = time.monotonic()
+            await asyncio.gather(*(check(job) for job in pending))
+            recorder.check_round(time.monotonic() - round_started)
+            recorder.save(attempt, "running", statuses)
+
+            completed = statuses.count("completed")
+            failed = total - completed - len(
+                [status for status in statuses if status in RETRYABLE_STATUSES]
+            )
+            outcome = _policy_outcome(args.completion, total, completed, failed)
+            summary = f"{completed}/{total} completed, {failed} failed"
+            if outcome == 0:
+                print(f"task completed ({summary})", flush=True)
                 return 0
-            if exit_code in FATAL_EXIT_CODES:
-                _print_attempt(
-                    attempt=attempt,
-                    exit_code=exit_code,
-                    status="fatal_command_error",
-                    output=output,
-                    quiet=args.quiet,
-                )
-                print(
-                    f"fatal check command error (exit code {exit_code})",
-                    flush=True,
-                )
+            if outcome == 2:
+                print(f"completion policy can no longer be met ({summary})", flush=True)
                 return 2
-            _print_attempt(
-                attempt=attempt,
-                exit_code=exit_code,
-                status="pending",
-                output=output,
-                quiet=args.quiet,
+
+            if args.max_attempts and attempt >= args.max_attempts:
+                print(f"max attempts reached ({summary})", flush=True)
+                return 1
+            if _timed_out(start_time, args.timeout_seconds):
+                print(f"timeout reached ({summary})", flush=True)
+                return 1
+
+            await asyncio.sleep(_sleep_seconds(args, start_time, next(delays)))
+    finally:
+        # Each hook is bounded by --on-change-timeout, so this wait is too.
+        if hook_tasks:
+            await asyncio.gather(*hook_tasks, return_exceptions=True)
+
+
+def _decode_lines(buffer: bytes, chunk: bytes, limit: int) -> tuple[list[str], bytes]:
+    *lines, rest = (buffer + chunk).split(b"\n")
+    # A runaway line without newlines keeps only its last `limit` bytes.
+    rest = rest[-limit:]
+    return [line.decode("utf-8", "replace").rstrip("\r") for line in lines], rest
+
+
+def _follow_file_lines(path: str, deadline: float, limit: int) -> Iterator[tuple[str, bool]]:
+    # Yields (line, continues_previous): a line that was first yielded while still
+    # unterminated is yielded again once complete, as the same line.
+    handle = None
+    buffer = b""
+    partial_seen = False
+    partial_yielded = False
+    try:
+        while time.monotonic() < deadline:
+            if handle is None:
+                try:
+                    handle = open(path, "rb")
+                except FileNotFoundError:
+                    time.sleep(FOLLOW_POLL_SECONDS)
+                    continue
+            chunk = handle.read(65536)
+            if chunk:
+                lines, buffer = _decode_lines(buffer, chunk, limit)
+                partial_seen = False
+                for line in lines:
+                    yield line, partial_yielded
+                    partial_yielded = False
+                continue
+            if buffer and not partial_seen:
+                # Status files are often written without a trailing newline.
+                partial_seen = True
+                yield buffer.decode("utf-8", "replace"), partial_yielded
+                partial_yielded = True
+            # Reopen when the log is rotated or truncated, like `tail -F`.
+            try:
+                current = os.stat(path)
+            except FileNotFoundError:
+                current = None
+            opened = os.fstat(handle.fileno())
+            if current is not None and (
+                current.st_ino != opened.st_ino or current.st_size < handle.tell()
+            ):
+                handle.close()
+                handle = None
+                buffer = b""
+                partial_yielded = False
+                continue
+            time.sleep(FOLLOW_POLL_SECONDS)
+    finally:
+        if handle is not None:
+            handle.close()
+
+
+def _follow_command_lines(
+    process: subprocess.Popen, deadline: float, limit: int
+) -> Iterator[tuple[str, bool]]:
+    fd = process.stdout.fileno()
+    buffer = b""
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            return
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            if buffer:
+                yield buffer.decode("utf-8", "replace"), False
+            return
+        lines, buffer = _decode_lines(buffer, chunk, limit)
+        for line in lines:
+            yield line, False
+
+
+def _print_line_match(line_no: int, status: str, line: str, quiet: bool) -> None:
+    if quiet:
+        return
+    print(f"[{_utc_timestamp()}] line={line_no} status={status}", flush=True)
+    print(f"  output={_compact_output(line)}", flush=True)
+
+
+def run_follow(args: argparse.Namespace, recorder: PollRecorder) -> int:
+    success_pattern, failure_patterns = _compile_patterns(args)
+    if args.follow_file and success_pattern is None:
+        raise ValueError("--follow-file requires --success-regex")
+    # Following restarts from the top of the stream, so only the timeout carries over.
+    deadline = recorder.start_time + args.timeout_seconds
+    recorder.save(0, "following")
+    process = None
+    if args.follow_cmd:
+        # Own process group, so the whole pipeline (for example `kubectl logs -f`)
+        # is stopped once a match is found or the timeout hits.
+        if args.exec_mode == "direct":
+            argv = shlex.split(args.follow_cmd)
+        else:
+            argv = ["/bin/sh", "-lc", args.follow_cmd]
+        process = subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+        lines = _follow_command_lines(process, deadline, args.max_output_bytes)
+    else:
+        lines = _follow_file_lines(args.follow_file, deadline, args.max_output_bytes)
+
+    try:
+        line_no = 0
+        for line, continues_previous in lines:
+            if not continues_previous:
+                line_no += 1
+            if _matches_any(failure_patterns, line):
+                _print_line_match(line_no, "failure_pattern_matched", line, args.quiet)
+                recorder.event(line=line_no, status="failure_pattern_matched")
+                print("terminal failure pattern detected", flush=True)
+                return 2
+            if success_pattern is not None and success_pattern.search(line):
+                _print_line_match(line_no, "completed", line, args.quiet)
+                recorder.event(line=line_no, status="completed")
+                print("task completed", flush=True)
+                return 0
+        if process is not None and time.monotonic() < deadline:
+            exit_code = process.wait()
+            recorder.event(exit_code=exit_code, status="follow_exited")
+            if success_pattern is None and exit_code == 0:
+                print("task completed", flush=True)
+                return 0
+            print(
+                f"follow command exited (exit code {exit_code}) "
+                "before completion was detected",
+                flush=True,
             )
+            return 2
+        print("timeout reached", flush=True)
+        return 1
+    finally:
+        lines.close()
+        if process is not None:
+            # TERM, then KILL after a grace period, so a command that traps TERM
+            # cannot keep the poller from exiting.
+            _stop_process_group(process)
+            process.stdout.close()
+
+
+class _InotifyPathWatcher:
+    """Wake on any entry change in the directories holding the watched paths."""
+
+    kind = "inotify"
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def arm(self, directories: set[str]) -> None:
+        # Re-adding an existing watch is a no-op, so this runs before every check;
+        # a directory created since the last wake-up is watched before it is stat'ed.
+        for directory in directories:
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WAIT_PATH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {directory}")
+
+    def _drain(self) -> None:
+        try:
+            while os.read(self._fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+
+    def wait(self, timeout: float) -> None:
+        if select.select([self._fd], [], [], timeout)[0]:
+            self._drain()
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _StatPathWatcher:
+    kind = "polling"
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+
+    def arm(self, directories: set[str]) -> None:
+        pass
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(min(self._interval, timeout))
+
+    def close(self) -> None:
+        pass
+
+
+def _watch_directory(path: str) -> str:
+    # The nearest existing ancestor, so a sentinel whose directory does not exist
+    # yet is still noticed once the directory tree is created.
+    directory = os.path.dirname(os.path.abspath(path))
+    while not os.path.isdir(directory):
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    return directory
+
+
+def _filesystem_type(path: str) -> str | None:
+    path = os.path.realpath(path)
+    best_mount, best_type = "", None
+    try:
+        with open("/proc/self/mounts", encoding="utf-8") as handle:
+            for line in handle:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                mount = fields[1].replace("\\040", " ")
+                if (path == mount or path.startswith(mount.rstrip("/") + "/")) and len(mount) >= len(best_mount):
+                    best_mount, best_type = mount, fields[2]
+    except OSError:
+        return None
+    return best_type
+
+
+def _make_path_watcher(args: argparse.Namespace, paths: list[str]):
+    if not args.wait_path_polling and sys.platform.startswith("linux"):
+        for path in paths:
+            fs_type = _filesystem_type(_watch_directory(path)) or ""
+            if fs_type in NETWORK_FS_TYPES or fs_type.startswith("fuse"):
+                return _StatPathWatcher(args.stat_interval_seconds)
+        try:
+            watcher = _InotifyPathWatcher()
+        except (OSError, AttributeError):
+            # No inotify symbols; polling still works.
+            return _StatPathWatcher(args.stat_interval_seconds)
+        try:
+            watcher.arm({_watch_directory(path) for path in paths})
+        except OSError:
+            # Watch limit reached; fall back rather than miss the sentinel.
+            watcher.close()
+            return _StatPathWatcher(args.stat_interval_seconds)
+        return watcher
+    return _StatPathWatcher(args.stat_interval_seconds)
+
+
+def _path_signature(path: str) -> tuple[int, int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _read_tail(path: str, limit: int) -> str:
+    try:
+        with open(path, "rb") as handle:
+            handle.seek(0, os.SEEK_END)
+            handle.seek(max(0, handle.tell() - limit))
+            return handle.read(limit).decode("utf-8", "replace")
+    except OSError:
+        return ""
+
+
+def run_wait_paths(args: argparse.Namespace, recorder: PollRecorder) -> int:
+    success_pattern, failure_patterns = _compile_patterns(args)
+    regex_mode = success_pattern is not None or bool(failure_patterns)
+    paths = list(args.wait_path)
+    deadline = recorder.start_time + args.timeout_seconds
+    recorder.save(0, "waiting")
+    watcher = _make_path_watcher(args, paths + args.failure_path)
+    if not args.quiet:
+        print(f"waiting on {len(paths)} path(s) ({watcher.kind})", flush=True)
+    # Files are re-read only when their signature changes, so idle wake-ups are cheap.
+    seen: dict[str, tuple[tuple[int, int, int] | None, str]] = {}
+
+    def path_status(path: str) -> str:
+        signature = _path_signature(path)
+        previous = seen.get(path)
+        if previous is not None and previous[0] == signature:
+            return previous[1]
+        if signature is None:
+            status = "missing"
+        elif not regex_mode:
+            status = "completed"
         else:
-            if output and success_pattern.search(output):
-                _print_attempt(
-                    attempt=attempt,
-                    exit_code=exit_code,
-                    status="completed",
-                    output=output,
-                    quiet=args.quiet,
-                )
+            content = _read_tail(path, args.max_output_bytes)
+            if _matches_any(failure_patterns, content):
+                status = "failure_pattern_matched"
+            elif success_pattern is None or success_pattern.search(content):
+                status = "completed"
+            else:
+                status = "pending"
+        seen[path] = (signature, status)
+        if previous is None or previous[1] != status:
+            recorder.event(path=path, status=status)
+            if not args.quiet and (previous is not None or signature is not None):
+                print(f"[{_utc_timestamp()}] path={path} status={status}", flush=True)
+        return status
+
+    try:
+        while True:
+            watcher.arm({_watch_directory(path) for path in paths + args.failure_path})
+            for path in args.failure_path:
+                if _path_signature(path) is not None:
+                    recorder.event(path=path, status="failure_path_present")
+                    print(f"failure path detected: {path}", flush=True)
+                    return 2
+            statuses = [path_status(path) for path in paths]
+            completed = statuses.count("completed")
+            failed = statuses.count("failure_pattern_matched")
+            outcome = _policy_outcome(args.completion, len(paths), completed, failed)
+            if outcome == 0:
                 print("task completed", flush=True)
                 return 0
-            if exit_code != 0 and not args.retry_on_nonzero:
-                terminal_state = (
-                    "fatal_command_error"
-                    if exit_code in FATAL_EXIT_CODES
-                    else "nonzero_exit_in_regex_mode"
-                )
-                _print_attempt(
-                    attempt=attempt,
-                    exit_code=exit_code,
-                    status=terminal_state,
-                    output=output,
-                    quiet=args.quiet,
-                )
-                print(
-                    "check command exited non-zero in regex mode; "
-                    "use --retry-on-nonzero to keep polling",
-                    flush=True,
-                )
+            if outcome == 2:
+                if len(paths) == 1:
+                    print("terminal failure pattern detected", flush=True)
+                else:
+                    print(
+                        f"completion policy can no longer be met "
+                        f"({completed}/{len(paths)} completed, {failed} failed)",
+                        flush=True,
+                    )
                 return 2
-            _print_attempt(
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print("timeout reached", flush=True)
+                return 1
+            watcher.wait(remaining)
+    finally:
+        watcher.close()
+
+
+def _parse_slurm_rows(output: str) -> dict[str, list[str]]:
+    # "JOBID,STATE" lines from squeue --format=%i,%T or sacct --parsable2 --delimiter=,.
+    # sacct reports cancellations as "CANCELLED by UID"; only the base state is kept.
+    rows: dict[str, list[str]] = {}
+    for line in output.splitlines():
+        job_id, separator, state = line.strip().partition(",")
+        if not separator or not re.fullmatch(r"\d+(_[\d\[\]\-,%]+)?", job_id):
+            continue
+        words = state.split()
+        if words:
+            rows.setdefault(job_id, []).append(words[0].rstrip("+"))
+    return rows
+
+
+def _slurm_job_state(
+    job_id: str,
+    rows: dict[str, list[str]],
+    success_states: tuple[str, ...],
+    failure_states: tuple[str, ...],
+) -> str | None:
+    # A bare array job ID covers all of its tasks: any failed task fails it, and
+    # it completes only once every reported task has completed.
+    states = list(rows.get(job_id, []))
+    for row_id, row_states in rows.items():
+        if row_id.startswith(f"{job_id}_"):
+            states.extend(row_states)
+    if not states:
+        return None
+    for state in states:
+        if state in failure_states:
+            return state
+    for state in states:
+        if state not in success_states:
+            return state
+    return states[0]
+
+
+def _query_slurm(
+    args: argparse.Namespace, job_ids: list[str], deadline: float
+) -> tuple[int, str, dict[str, list[str]]]:
+    # squeue knows active and recently finished jobs; sacct is asked only about the
+    # rest, so each round costs the controller at most two calls for all jobs.
+    prefix = shlex.split(args.slurm_prefix) if args.slurm_prefix else []
+    joined = ",".join(job_ids)
+    exit_code, output = _run_check_argv(
+        shlex.join(
+            prefix
+            + ["squeue", "--noheader", "--array", "--states=all", "--format=%i,%T", f"--jobs={joined}"]
+        ),
+        deadline,
+        args.max_output_bytes,
+    )
+    rows = _parse_slurm_rows(output)
+    unresolved = [
+        job_id
+        for job_id in job_ids
+        if _slurm_job_state(job_id, rows, args.slurm_success_states, args.slurm_failure_states) is None
+    ]
+    if unresolved and exit_code not in FATAL_EXIT_CODES and exit_code != ATTEMPT_TIMEOUT_EXIT_CODE:
+        # Older squeue exits 1 for IDs it no longer knows; sacct's answer decides then.
+        exit_code, output = _run_check_argv(
+            shlex.join(
+                prefix
+                + [
+                    "sacct", "--noheader", "--parsable2", "--delimiter=,", "--allocations",
+                    "--format=JobID,State", f"--jobs={','.join(unresolved)}",
+                ]
+            ),
+            deadline,
+            args.max_output_bytes,
+        )
+        rows.update(_parse_slurm_rows(output))
+    return exit_code, output, rows
+
+
+def run_slurm_jobs(args: argparse.Namespace, recorder: PollRecorder) -> int:
+    job_ids = args.slurm_jobs
+    total = len(job_ids)
+    statuses = list(recorder.job_statuses or ["pending"] * total)
+    reported: list[str | None] = [None] * total
+    start_time = recorder.start_time
+    attempt = recorder.attempt
+    delays = _poll_delays(args, random.Random())
+    if attempt:
+        # Resumed after an interruption: the saved budget may already be spent.
+        spent = _budget_spent(args, start_time, attempt)
+        if spent:
+            print(f"{spent} ({statuses.count('completed')}/{total} completed)", flush=True)
+            return 1
+
+    while True:
+        attempt += 1
+        active = [index for index in range(total) if statuses[index] in RETRYABLE_STATUSES]
+        started = time.monotonic()
+        exit_code, output, rows = _query_slurm(
+            args, [job_ids[index] for index in active], _attempt_deadline(args, start_time)
+        )
+        latency_s = time.monotonic() - started
+        recorder.check_round(latency_s)
+        # One event for the shared query, so its latency is counted once per round
+        # rather than once per job.
+        recorder.event(
+            attempt=attempt,
+            check_cmd="squeue/sacct",
+            jobs=len(active),
+            latency_s=round(latency_s, 6),
+            exit_code=exit_code,
+        )
+        if exit_code in FATAL_EXIT_CODES:
+            print(f"fatal Slurm query error (exit code {exit_code}): {_compact_output(output)}", flush=True)
+            return 2
+        if exit_code != 0 and not args.quiet:
+            # A busy or restarting controller is retried on the next round.
+            print(
+                f"[{_utc_timestamp()}] attempt={attempt} Slurm query exit_code={exit_code}",
+                flush=True,
+            )
+            if output:
+                print(f"  output={_compact_output(output)}", flush=True)
+
+        for index in active:
+            job_id = job_ids[index]
+            state = _slurm_job_state(
+                job_id, rows, args.slurm_success_states, args.slurm_failure_states
+            )
+            if state in args.slurm_success_states:
+                status = "completed"
+            elif state in args.slurm_failure_states:
+                status = "failed_state"
+            else:
+                status = "pending"
+            statuses[index] = status
+            recorder.event(
                 attempt=attempt,
-                exit_code=exit_code,
-                status="pending",
-                output=output,
-                quiet=args.quiet,
+                job=job_id,
+                state=state,
+                status=status,
             )
+            label = state or "not_found"
+            if reported[index] != label and not args.quiet:
+                print(
+                    f"[{_utc_timestamp()}] job={job_id} attempt={attempt} "
+                    f"state={label} status={status}",
+                    flush=True,
+                )
+            reported[index] = label
+        recorder.save(attempt, "running", statuses)
+
+        completed = statuses.count("completed")
+        failed = statuses.count("failed_state")
+        outcome = _policy_outcome(args.completion, total, completed, failed)
+        summary = f"{completed}/{total} completed, {failed} failed"
+        if outcome == 0:
+            print(f"task completed ({summary})", flush=True)
+            return 0
+        if outcome == 2:
+            print(f"completion policy can no longer be met ({summary})", flush=True)
+            return 2
 
         if args.max_attempts and attempt >= args.max_attempts:
-            print("max attempts reached", flush=True)
+            print(f"max attempts reached ({summary})", flush=True)
             return 1
         if _timed_out(start_time, args.timeout_seconds):
-            print("timeout reached", flush=True)
+            print(f"timeout reached ({summary})", flush=True)
             return 1
 
-        time.sleep(args.interval_seconds)
+        time.sleep(_sleep_seconds(args, start_time, next(delays)))
 
 
 def main() -> int:
     parser = _build_parser()
     args = parser.parse_args()
     try:
-        return run_poll_loop(args)
+        check_cmds = list(args.check_cmd)
+        if args.check_cmd_file:
+            check_cmds.extend(_read_check_cmd_file(args.check_cmd_file))
+        following = bool(args.follow_file or args.follow_cmd)
+        if following and check_cmds:
+            raise ValueError("--follow-file/--follow-cmd replace --check-cmd polling")
+        if args.wait_path and check_cmds:
+            raise ValueError("--wait-path replaces --check-cmd polling")
+        if args.check_url and check_cmds:
+            raise ValueError("--check-url replaces --check-cmd polling")
+        if (args.header or args.json_path) and not args.check_url:
+            raise ValueError("--header and --json-path require --check-url")
+        if args.json_path and not (args.success_regex or args.failure_regex):
+            raise ValueError("--json-path requires --success-regex or --failure-regex")
+        if args.check_url:
+            check_cmds = [args.check_url]
+        # Flattened and de-duplicated, keeping the order given.
+        args.slurm_jobs = list(dict.fromkeys(job_id for group in args.slurm_jobs for job_id in group))
+        if args.slurm_jobs and check_cmds:
+            raise ValueError("--slurm-jobs replaces --check-cmd polling")
+        if args.slurm_jobs and (args.success_regex or args.failure_regex):
+            raise ValueError(
+                "--slurm-jobs matches job states; use --slurm-success-states/--slurm-failure-states"
+            )
+        if args.on_change and (following or args.wait_path or args.slurm_jobs):
+            raise ValueError("--on-change applies to --check-cmd and --check-url polling")
+        if args.failure_path and not args.wait_path:
+            raise ValueError("--failure-path requires --wait-path")
+        if not (following or args.wait_path or args.slurm_jobs or check_cmds):
+            raise ValueError("provide --check-cmd or a non-empty --check-cmd-file")
+        if args.exec_mode == "persistent-shell" and (args.follow_cmd or len(check_cmds) > 1):
+            raise ValueError(
+                "--exec-mode persistent-shell runs one --check-cmd at a time; "
+                "use login-shell or direct for several jobs or --follow-cmd"
+            )
+        if args.exec_mode == "direct":
+            for check_cmd in check_cmds + ([args.follow_cmd] if args.follow_cmd else []):
+                try:
+                    shlex.split(check_cmd)
+                except ValueError as error:
+                    raise ValueError(
+                        f"cannot split {check_cmd!r} for --exec-mode direct: {error}"
+                    ) from error
+        name, quorum = args.completion
+        if args.wait_path and name == "quorum" and quorum > len(args.wait_path):
+            raise ValueError(
+                f"--completion quorum={quorum} exceeds the {len(args.wait_path)} --wait-path(s)"
+            )
+        if args.slurm_jobs and name == "quorum" and quorum > len(args.slurm_jobs):
+            raise ValueError(
+                f"--completion quorum={quorum} exceeds the {len(args.slurm_jobs)} Slurm job(s)"
+            )
+        if check_cmds and name == "quorum" and quorum > len(check_cmds):
+            raise ValueError(
+                f"--completion quorum={quorum} exceeds the {len(check_cmds)} check command(s)"
+            )
+        if args.events and not args.events_file:
+            raise ValueError("--events requires --events-file")
+        if args.metrics and not args.metrics_file:
+            raise ValueError("--metrics requires --metrics-file")
+        if args.follow_file:
+            state_key = [f"follow-file:{args.follow_file}"]
+        elif args.follow_cmd:
+            state_key = [f"follow-cmd:{args.follow_cmd}"]
+        elif args.wait_path:
+            state_key = [f"wait-path:{path}" for path in args.wait_path + args.failure_path]
+        elif args.slurm_jobs:
+            state_key = [f"slurm:{job_id}" for job_id in args.slurm_jobs]
+        else:
+            state_key = check_cmds
+        events_file = args.events_file if args.events else None
+        recorder = PollRecorder(
+            args.state_file,
+            events_file,
+            state_key,
+            args.quiet,
+            metrics=PollMetrics(args.metrics_label) if args.metrics else None,
+            metrics_format=args.metrics,
+            metrics_file=args.metrics_file,
+        )
+        # Metrics are written on every exit, including interrupts (130).
+        result = 130
+        try:
+            if following:
+                result = run_follow(args, recorder)
+            elif args.wait_path:
+                result = run_wait_paths(args, recorder)
+            elif args.slurm_jobs:
+                result = run_slurm_jobs(args, recorder)
+            elif len(check_cmds) == 1:
+                args.check_cmd = check_cmds
+                result = run_poll_loop(args, recorder)
+            else:
+                result = asyncio.run(_poll_jobs(args, check_cmds, recorder))
+        except ValueError:
+            result = 2
+            raise
+        finally:
+            recorder.close(result)
+        # Interrupted waits keep their state file so a rerun can resume them.
+        recorder.finish()
+        return result
     except ValueError as error:
         parser.error(str(error))
     except KeyboardInterrupt: